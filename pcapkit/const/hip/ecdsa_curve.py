@@ -37,11 +37,16 @@ class ECDSACurve(IntEnum):
 
         :meta private:
         """
+        if type(key) is int:  # pylint: disable=unidiomatic-typecheck
+            member = ECDSACurve._v2m.get(key)  # pylint: disable=no-member
+            if member is not None:
+                return member
         if isinstance(key, int):
             return ECDSACurve(key)
-        if key not in ECDSACurve._member_map_:  # pylint: disable=no-member
+        try:
+            return ECDSACurve._member_map_[key]  # type: ignore[return-value] # pylint: disable=no-member
+        except KeyError:
             return extend_enum(ECDSACurve, key, default)
-        return ECDSACurve[key]  # type: ignore[misc]
 
     @classmethod
     def _missing_(cls, value: 'int') -> 'ECDSACurve':
@@ -51,9 +56,13 @@ class ECDSACurve(IntEnum):
             value: Value to get enum item.
 
         """
-        if not (isinstance(value, int) and 0 <= value <= 65535):
+        if not (type(value) is int and 0 <= value <= 65535):  # pylint: disable=unidiomatic-typecheck
             raise ValueError('%r is not a valid %s' % (value, cls.__name__))
         if 3 <= value <= 65535:
             #: Unassigned
             return extend_enum(cls, 'Unassigned_%d' % value, value)
         return super()._missing_(value)
+
+
+#: Cached value-to-member mapping of :class:`ECDSACurve` for fast lookup.
+ECDSACurve._v2m = ECDSACurve._value2member_map_  # type: ignore[attr-defined] # pylint: disable=protected-access
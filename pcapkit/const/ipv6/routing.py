@@ -60,11 +60,14 @@ class Routing(IntEnum):
 
         :meta private:
         """
+        if type(key) is int and 0 <= key <= 255:  # pylint: disable=unidiomatic-typecheck
+            return Routing._table[key]  # type: ignore[no-any-return] # pylint: disable=no-member
         if isinstance(key, int):
             return Routing(key)
-        if key not in Routing._member_map_:  # pylint: disable=no-member
+        try:
+            return Routing._member_map_[key]  # type: ignore[return-value] # pylint: disable=no-member
+        except KeyError:
             return extend_enum(Routing, key, default)
-        return Routing[key]  # type: ignore[misc]
 
     @classmethod
     def _missing_(cls, value: 'int') -> 'Routing':
@@ -74,9 +77,16 @@ class Routing(IntEnum):
             value: Value to get enum item.
 
         """
-        if not (isinstance(value, int) and 0 <= value <= 255):
+        if not (type(value) is int and 0 <= value <= 255):  # pylint: disable=unidiomatic-typecheck
             raise ValueError('%r is not a valid %s' % (value, cls.__name__))
-        if 7 <= value <= 252:
-            #: Unassigned
-            return extend_enum(cls, 'Unassigned_%d' % value, value)
-        return super()._missing_(value)
+        return cls._table[value]  # type: ignore[attr-defined,no-any-return]
+
+
+#: Unassigned
+for _value in range(7, 253):
+    extend_enum(Routing, 'Unassigned_%d' % _value, _value)
+del _value
+
+#: Value-to-member lookup table of :class:`Routing` indexed by the byte value,
+#: frozen as all members have been materialised.
+Routing._table = tuple(Routing._value2member_map_[value] for value in range(256))  # type: ignore[attr-defined] # pylint: disable=protected-access
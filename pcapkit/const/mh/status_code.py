@@ -209,11 +209,14 @@ class StatusCode(IntEnum):
 
         :meta private:
         """
+        if type(key) is int and 0 <= key <= 255:  # pylint: disable=unidiomatic-typecheck
+            return StatusCode._table[key]  # type: ignore[no-any-return] # pylint: disable=no-member
         if isinstance(key, int):
             return StatusCode(key)
-        if key not in StatusCode._member_map_:  # pylint: disable=no-member
+        try:
+            return StatusCode._member_map_[key]  # type: ignore[return-value] # pylint: disable=no-member
+        except KeyError:
             return extend_enum(StatusCode, key, default)
-        return StatusCode[key]  # type: ignore[misc]
 
     @classmethod
     def _missing_(cls, value: 'int') -> 'StatusCode':
@@ -223,10 +226,19 @@ class StatusCode(IntEnum):
             value: Value to get enum item.
 
         """
-        if not (isinstance(value, int) and 0 <= value <= 255):
+        if not (type(value) is int and 0 <= value <= 255):  # pylint: disable=unidiomatic-typecheck
             raise ValueError('%r is not a valid %s' % (value, cls.__name__))
-        if 7 <= value <= 127:
-            #: Unassigned
-            return extend_enum(cls, 'Unassigned_%d' % value, value)
-        #: Unspecified in the IANA registry
-        return extend_enum(cls, 'Unassigned_%d' % value, value)
+        return cls._table[value]  # type: ignore[attr-defined,no-any-return]
+
+
+#: Unassigned
+for _value in range(7, 128):
+    extend_enum(StatusCode, 'Unassigned_%d' % _value, _value)
+#: Unspecified in the IANA registry
+for _value in range(181, 256):
+    extend_enum(StatusCode, 'Unassigned_%d' % _value, _value)
+del _value
+
+#: Value-to-member lookup table of :class:`StatusCode` indexed by the byte value,
+#: frozen as all members have been materialised.
+StatusCode._table = tuple(StatusCode._value2member_map_[value] for value in range(256))  # type: ignore[attr-defined] # pylint: disable=protected-access
@@ -16,7 +16,7 @@ and :class:`~pcapkit.corekit.multidict.MultiDict` family inspired from
 etc.
 
 """
-from pcapkit.corekit.io import SeekableReader
+from pcapkit.corekit.io import MemoryMappedReader, SeekableReader
 from pcapkit.corekit.fields import *
 from pcapkit.corekit.infoclass import Info, info_final
 from pcapkit.corekit.module import ModuleDescriptor
@@ -53,7 +53,7 @@ __all__ = [
     'IPv4AddressField', 'IPv6AddressField',
     'IPv4InterfaceField', 'IPv6InterfaceField',
 
-    'SeekableReader',
+    'SeekableReader', 'MemoryMappedReader',
 
     'ModuleDescriptor',
 ]
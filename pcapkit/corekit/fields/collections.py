@@ -1,11 +1,11 @@
 # -*- coding: utf-8 -*-
 """container field class"""
 
-import copy
-import io
+from io import SEEK_CUR, BytesIO
 from typing import TYPE_CHECKING, Generic, TypeVar, cast
 
 from pcapkit.corekit.fields.field import FieldBase
+from pcapkit.corekit.fields.misc import SchemaField, _get_schema
 from pcapkit.corekit.multidict import OrderedMultiDict
 from pcapkit.utilities.compat import List
 from pcapkit.utilities.exceptions import FieldValueError
@@ -79,7 +79,8 @@ class ListField(FieldBase[List[_TL]], Generic[_TL]):
         instead of updating the current instance.
 
         """
-        new_self = copy.copy(self)
+        new_self = object.__new__(self.__class__)
+        new_self.__dict__ = self.__dict__.copy()
         new_self._callback(self, packet)
         if new_self._length_callback is not None:
             new_self._length = new_self._length_callback(packet)
@@ -100,20 +101,19 @@ class ListField(FieldBase[List[_TL]], Generic[_TL]):
         if value is None:
             return b''
 
-        from pcapkit.protocols.schema.schema import \
-            Schema  # pylint: disable=import-outside-top-level
+        schema_type = _get_schema()
 
-        temp = []  # type: list[bytes]
+        temp = bytearray()
         for item in value:
             if isinstance(item, bytes):
-                temp.append(item)
-            elif isinstance(item, Schema):
-                temp.append(item.pack(packet))
+                temp += item
+            elif isinstance(item, schema_type):
+                temp += item.pack(packet)
             elif self._item_type is not None:
-                temp.append(self._item_type.pack(item, packet))
+                temp += self._item_type.pack(item, packet)
             else:
                 raise FieldValueError(f'Field {self.name} has invalid value.')
-        return b''.join(temp)
+        return bytes(temp)
 
     def unpack(self, buffer: 'bytes | IO[bytes]', packet: 'dict[str, Any]') -> 'bytes | list[_TL]':
         """Unpack field value from :obj:`bytes`.
@@ -127,36 +127,69 @@ class ListField(FieldBase[List[_TL]], Generic[_TL]):
 
         """
         length = self._length
-        if isinstance(buffer, bytes):
-            file = io.BytesIO(buffer)  # type: IO[bytes]
-        else:
-            file = buffer
-
-        if self._item_type is None:
-            return file.read(length)
+        is_bytes = isinstance(buffer, bytes)
+
+        # slice over the input bytes directly rather than wrapping
+        # them into a file-like object unless we need to
+        item_type = self._item_type
+        if item_type is None:
+            if is_bytes:
+                return cast('bytes', buffer) if length < 0 else cast('bytes', buffer)[:length]
+            return cast('IO[bytes]', buffer).read(length)
+        is_schema = isinstance(item_type, SchemaField)
+
+        if not is_schema and length > 0:
+            field = item_type if item_type.is_stateless else item_type(packet)
+            field_length = field.length
+
+            # for constant-length items, read the whole buffer at once
+            # and slice it into items rather than reading per item
+            if field_length > 0:
+                count, remainder = divmod(length, field_length)
+                if remainder:
+                    raise FieldValueError(f'Field {self.name} has invalid length.')
 
-        from pcapkit.corekit.fields.misc import SchemaField
-        is_schema = isinstance(self._item_type, SchemaField)
+                if is_bytes:
+                    data = cast('bytes', buffer)[:length]
+                else:
+                    data = cast('IO[bytes]', buffer).read(length)
+
+                field_unpack = field.unpack
+                items = [None] * count  # type: list[Any]
+                offset = 0
+                for index in range(count):
+                    items[index] = field_unpack(data[offset:offset + field_length], packet)
+                    offset += field_length
+                return items
+
+        if is_bytes:
+            file = BytesIO(buffer)  # type: IO[bytes]
+        else:
+            file = cast('IO[bytes]', buffer)
 
+        # bind frequently used methods to local names
+        read = file.read
         temp = []  # type: list[_TL]
+        append = temp.append
         while length > 0:
-            field = self._item_type(packet)
+            field = item_type(packet)
 
             if is_schema:
-                data = cast('SchemaField', self._item_type).unpack(file, packet)
+                data = cast('SchemaField', item_type).unpack(file, packet)
 
                 length -= len(data)
                 if length < 0:
                     raise FieldValueError(f'Field {self.name} has invalid length.')
             else:
-                length -= field.length
+                field_length = field.length
+                length -= field_length
                 if length < 0:
                     raise FieldValueError(f'Field {self.name} has invalid length.')
 
-                buffer = file.read(field.length)
+                buffer = read(field_length)
                 data = field.unpack(buffer, packet)
 
-            temp.append(data)
+            append(data)
         return temp
 
 
@@ -228,6 +261,19 @@ class OptionField(ListField, Generic[_TS]):
             raise FieldValueError('Field <option> has no registry.')
         self._registry = registry
 
+        # if the option type is the leading (plain) field of the base schema,
+        # we may peek the option type with the field itself rather than
+        # unpacking the whole base schema for each option, as long as the
+        # base schema does not customise the unpacking process
+        self._type_field = None  # type: Optional[FieldBase]
+        first_name, first_field = next(iter(base_schema.__fields__.items()))
+        schema = _get_schema()
+        if (first_name == type_name and not first_field.optional
+                and base_schema.unpack.__func__ is schema.unpack.__func__  # type: ignore[attr-defined]
+                and base_schema.pre_unpack.__func__ is schema.pre_unpack.__func__  # type: ignore[attr-defined]
+                and base_schema.post_process is schema.post_process):
+            self._type_field = first_field
+
     def unpack(self, buffer: 'bytes | IO[bytes]', packet: 'dict[str, Any]') -> 'list[_TS]':
         """Unpack field value from :obj:`bytes`.
 
@@ -247,7 +293,7 @@ class OptionField(ListField, Generic[_TS]):
         """
         length = self._length
         if isinstance(buffer, bytes):
-            file = io.BytesIO(buffer)  # type: IO[bytes]
+            file = BytesIO(buffer)  # type: IO[bytes]
         else:
             file = buffer
 
@@ -256,26 +302,56 @@ class OptionField(ListField, Generic[_TS]):
         new_packet = packet.copy()
         new_packet[self.name] = OrderedMultiDict()
 
+        # bind frequently used methods to local names
+        read = file.read
+        seek = file.seek
+        type_field = self._type_field
+        base_unpack = self._base_schema.unpack
+        registry = self._registry
+        type_name = self._type_name
+        eool = self._eool
+        add = new_packet[self.name].add
+
+        # most recently looked up option schema, as options of the same
+        # type are likely to be repeated within the option list
+        last_code = -1  # type: int | StdlibEnum | AenumEnum
+        last_schema = None  # type: Optional[Type[_TS]]
+
         temp = []  # type: list[_TS]
+        append = temp.append
         while length > 0:
-            # unpack option type using base schema
-            meta = self._base_schema.unpack(file, length, packet)  # type: ignore[call-arg,misc,var-annotated]
-            code = cast('int', meta[self._type_name])
-            schema = self._registry[code]
+            if type_field is not None:
+                # peek option type using the type field
+                field = type_field(packet)
+                field_length = field.length
+                code = cast('int', field.unpack(read(field_length), packet))
+
+                # rewind to the beginning of the option
+                seek(-field_length, SEEK_CUR)
+            else:
+                # unpack option type using base schema
+                meta = base_unpack(file, length, packet)  # type: ignore[call-arg,misc,var-annotated]
+                code = cast('int', meta[type_name])
 
-            # rewind to the beginning of the option
-            file.seek(-len(meta), io.SEEK_CUR)
+                # rewind to the beginning of the option
+                seek(-len(meta), SEEK_CUR)
+
+            if code == last_code:
+                schema = last_schema
+            else:
+                schema = last_schema = registry[code]
+                last_code = code
 
             # unpack option using option schema
             data = schema.unpack(file, length, packet)  # type: ignore[call-arg,misc,var-annotated]
-            new_packet[self.name].add(code, data)
-            temp.append(data)
+            add(code, data)
+            append(data)
 
             # update length
             length -= len(data)
 
             # check for EOOL
-            if code == self._eool:
+            if code == eool:
                 break
 
         self._option_padding = length
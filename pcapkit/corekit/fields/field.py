@@ -34,6 +34,10 @@ class NoValueType:
 NoValue = NoValueType()
 
 
+def _no_callback(*_: 'Any') -> 'None':
+    """Default callback function for fields, which does nothing."""
+
+
 class FieldMeta(abc.ABCMeta, Generic[_T]):
     """Meta class to add dynamic support to :class:`FieldBase`.
 
@@ -105,6 +109,12 @@ class FieldBase(Generic[_T], metaclass=FieldMeta):
         """Field is optional."""
         return False
 
+    @property
+    def is_stateless(self) -> 'bool':
+        """Field is stateless, i.e., calling the field with packet data
+        results in an instance identical to the current one."""
+        return False
+
     def __call__(self, packet: 'dict[str, Any]') -> 'Self':
         """Update field attributes.
 
@@ -129,7 +139,7 @@ class FieldBase(Generic[_T], metaclass=FieldMeta):
 
         self._default = NoValue
         self._template = '0s'
-        self._callback = lambda *_: None
+        self._callback = _no_callback
 
     def __repr__(self) -> 'str':
         if not self.name.isidentifier():
@@ -234,9 +244,14 @@ class Field(FieldBase[_T], Generic[_T]):
         """Field template."""
         return self._template
 
+    @property
+    def is_stateless(self) -> 'bool':
+        """Field is stateless, i.e., it has neither callback nor length callback."""
+        return self._length_callback is None and self._callback is _no_callback
+
     def __init__(self, length: 'int | Callable[[dict[str, Any]], int]',
                  default: '_T | NoValueType' = NoValue,
-                 callback: 'Callable[[Self, dict[str, Any]], None]' = lambda *_: None) -> 'None':
+                 callback: 'Callable[[Self, dict[str, Any]], None]' = _no_callback) -> 'None':
         #self._name = '<unknown>'
         if not hasattr(self, '_name'):
             self._name = f'<{type(self).__name__[:-5].lower()}>'
@@ -2,7 +2,8 @@
 """miscellaneous field class"""
 
 import copy
-import io
+import operator
+from io import BytesIO
 from typing import TYPE_CHECKING, TypeVar, cast
 
 from pcapkit.corekit.fields.field import FieldBase, NoValue
@@ -28,6 +29,53 @@ _TS = TypeVar('_TS', bound='Schema')
 _TP = TypeVar('_TP', bound='Protocol')
 _TN = TypeVar('_TN', bound='NoValueType')
 
+#: Cached :class:`~pcapkit.protocols.schema.schema.Schema` class.
+_Schema = None  # type: Optional[Type[Schema]]
+
+
+def _get_schema() -> 'Type[Schema]':
+    """Get the :class:`~pcapkit.protocols.schema.schema.Schema` class.
+
+    The class is imported upon the first call to avoid circular imports,
+    and is then cached at module level for later use.
+
+    """
+    global _Schema  # pylint: disable=global-statement
+    if _Schema is None:
+        from pcapkit.protocols.schema.schema import \
+            Schema  # pylint: disable=import-outside-toplevel
+        _Schema = Schema
+    return _Schema
+
+
+#: Cached packing functions for :meth:`PayloadField.pack`, keyed by the
+#: type of the payload value.
+_PAYLOAD_PACKER = {
+    bytes: lambda value: value,
+}  # type: dict[Type[Any], Callable[[Any], bytes]]
+
+
+def _get_payload_packer(kind: 'Type[Any]') -> 'Callable[[Any], bytes]':
+    """Get the packing function for payload values of the given type.
+
+    Args:
+        kind: Type of the payload value.
+
+    Returns:
+        Packing function for the payload value.
+
+    """
+    packer = _PAYLOAD_PACKER.get(kind)
+    if packer is None:
+        if issubclass(kind, bytes):
+            packer = _PAYLOAD_PACKER[bytes]
+        elif issubclass(kind, _get_schema()):
+            packer = operator.methodcaller('pack')
+        else:
+            packer = operator.attrgetter('data')
+        _PAYLOAD_PACKER[kind] = packer
+    return packer
+
 
 class NoValueField(FieldBase[_TN]):
     """Schema field for no value type (or :obj:`None`)."""
@@ -142,12 +190,16 @@ class ConditionalField(FieldBase[_TC]):
             Updated field instance.
 
         This method will return a new instance of :class:`ConditionalField`
-        instead of updating the current instance.
+        instead of updating the current instance. If the condition is not
+        met, the current instance will be returned as is.
 
         """
-        new_self = copy.copy(self)
-        if new_self._condition(packet):
-            new_self._field = new_self._field(packet)
+        if not self._condition(packet):
+            return self
+
+        new_self = object.__new__(self.__class__)
+        new_self.__dict__ = self.__dict__.copy()
+        new_self._field = new_self._field(packet)
         return new_self
 
     def pre_process(self, value: '_TC', packet: 'dict[str, Any]') -> 'Any':  # pylint: disable=unused-argument
@@ -296,7 +348,8 @@ class PayloadField(FieldBase[_TP]):
         instead of updating the current instance.
 
         """
-        new_self = copy.copy(self)
+        new_self = object.__new__(self.__class__)
+        new_self.__dict__ = self.__dict__.copy()
         new_self._callback(new_self, packet)
         if new_self._length_callback is not None:
             new_self._length = new_self._length_callback(packet)
@@ -319,13 +372,7 @@ class PayloadField(FieldBase[_TP]):
                 raise NoDefaultValue(f'Field {self.name} has no default value.')
             value = cast('_TP', self._default)
 
-        from pcapkit.protocols.schema.schema import \
-            Schema  # pylint: disable=import-outside-top-level
-        if isinstance(value, bytes):
-            return value
-        if isinstance(value, Schema):
-            return value.pack()
-        return value.data  # type: ignore[union-attr]
+        return _get_payload_packer(type(value))(value)
 
     def unpack(self, buffer: 'bytes | IO[bytes]', packet: 'dict[str, Any]') -> '_TP':
         """Unpack field value from :obj:`bytes`.
@@ -344,7 +391,7 @@ class PayloadField(FieldBase[_TP]):
             return cast('_TP', buffer.read())
 
         if isinstance(buffer, bytes):
-            file = io.BytesIO(buffer)  # type: IO[bytes]
+            file = BytesIO(buffer)  # type: IO[bytes]
         else:
             file = buffer
 
@@ -611,7 +658,7 @@ class SchemaField(FieldBase[_TS]):
 
         """
         if isinstance(buffer, bytes):
-            file = io.BytesIO(buffer)  # type: IO[bytes]
+            file = BytesIO(buffer)  # type: IO[bytes]
         else:
             file = buffer
 
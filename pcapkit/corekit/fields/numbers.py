@@ -55,6 +55,16 @@ class NumberField(Field[int], Generic[_T]):
         """Field bit length."""
         return self._bit_length
 
+    @property
+    def is_stateless(self) -> 'bool':
+        """Field is stateless.
+
+        :class:`NumberField` always updates its bit mask and template upon
+        :meth:`self.__call__ <NumberField.__call__>`, thus it is never stateless.
+
+        """
+        return False
+
     def __init__(self, length: 'Optional[int | Callable[[dict[str, Any]], int]]' = None,
                  default: 'int | NoValueType' = NoValue, signed: 'bool' = False,
                  byteorder: 'Literal["little", "big"]' = 'big',
@@ -372,4 +382,10 @@ class EnumField(NumberField[Union[enum.IntEnum, aenum.IntEnum]]):
                 '<unassigned>': value,
             }, module='pcapkit.const', qualname='pcapkit.const.<unknown>')
             return getattr(unknown, '<unassigned>')
-        return self._namespace(value)
+
+        # probe the value-to-member mapping directly to bypass the enum
+        # metaclass call for known values
+        member = self._namespace._value2member_map_.get(value)  # pylint: disable=protected-access
+        if member is None:
+            return self._namespace(value)
+        return member  # type: ignore[return-value]
@@ -17,7 +17,7 @@ __all__ = [
 ]
 
 if TYPE_CHECKING:
-    from typing import Callable, Optional, Tuple
+    from typing import IO, Callable, Optional, Tuple
 
     from typing_extensions import Literal, Self
 
@@ -93,6 +93,27 @@ class BytesField(_TextField[bytes]):
             self._template = f'{self._length}s'
         return value
 
+    def unpack(self, buffer: 'bytes | IO[bytes]', packet: 'dict[str, Any]') -> 'bytes':
+        """Unpack field value from :obj:`bytes`.
+
+        Args:
+            buffer: Field buffer.
+            packet: Packet data.
+
+        Returns:
+            Unpacked field value.
+
+        Notes:
+            The field buffer is used as is, rather than being copied
+            through :func:`struct.unpack` with the ``{length}s`` template.
+
+        """
+        length = self.length
+        if not isinstance(buffer, bytes):
+            buffer = buffer.read(length)
+        value = buffer[:length].rjust(length, b'\x00')
+        return self.post_process(value, packet)
+
 
 class StringField(_TextField[str]):
     r"""String value for protocol fields.
@@ -207,11 +228,11 @@ class BitField(_TextField[Dict[str, Any]]):
             Processed field value.
 
         """
-        buffer = bytearray(self.length * 8)
+        buffer = bytearray(b'0' * (self.length * 8))
         for name, (start, len) in self._namespace.items():
             end = start + len
             buffer[start:end] = f'{value[name]:0{end - start}b}'.encode()
-        return int(b''.join(map(lambda x: b'1' if x else b'0', buffer)), 2).to_bytes(self.length, 'big')
+        return int(buffer, 2).to_bytes(self.length, 'big')
 
     def post_process(self, value: 'bytes', packet: 'dict[str, Any]') -> 'dict[str, Any]':  # pylint: disable=unused-argument
         """Process field value after parsing (unpacked).
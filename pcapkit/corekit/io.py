@@ -6,10 +6,12 @@
 
 :mod:`pcapkit.corekit.io` contains seekable I/O object
 :class:`~pcapkit.corekit.io.SeekableReader`, which is a customised
-implementation to :class:`io.BufferedReader`.
+implementation to :class:`io.BufferedReader`, and memory-mapped
+I/O object :class:`~pcapkit.corekit.io.MemoryMappedReader`.
 
 """
 import io
+import mmap
 import tempfile
 from typing import TYPE_CHECKING, cast
 
@@ -23,7 +25,7 @@ if TYPE_CHECKING:
 
     from typing_extensions import Buffer
 
-__all__ = ['SeekableReader']
+__all__ = ['SeekableReader', 'MemoryMappedReader']
 
 
 class SeekableReader(io.BufferedReader):
@@ -108,11 +110,14 @@ class SeekableReader(io.BufferedReader):
         self._buffer_size = buffer_size
 
         if buffer_save:
+            # NOTE: the buffer file is written with buffering, and is only
+            # flushed when we need to read back from it, so that sequential
+            # reads will not issue a write syscall upon every chunk of data
             if buffer_path is None:
-                self._buffer_file = tempfile.NamedTemporaryFile('wb', buffering=0)
+                self._buffer_file = tempfile.NamedTemporaryFile('wb')  # pylint: disable=consider-using-with
                 self._buffer_path = self._buffer_file.name
             else:
-                self._buffer_file = open(buffer_path, 'wb', buffering=0)
+                self._buffer_file = open(buffer_path, 'wb')  # pylint: disable=consider-using-with
                 self._buffer_path = buffer_path
         else:
             self._buffer_file = None
@@ -123,7 +128,6 @@ class SeekableReader(io.BufferedReader):
     def _write_buffer(self, buf: 'bytes', /) -> 'None':
         if self._buffer_file is not None:
             self._buffer_file.write(buf)
-            self._buffer_file.flush()
 
         buf_len = len(buf)
         old_ptr = self._buffer_cur
@@ -144,6 +148,27 @@ class SeekableReader(io.BufferedReader):
         else:
             self._buffer_view[old_ptr:self._buffer_cur] = buf
 
+    def _read_buffer(self, size: 'int', /) -> 'bytes':
+        # read up to ``size`` bytes of buffered contents at current position
+        start = self._tell - self._buffer_set
+        if size < 0:
+            return self._buffer_view[start:self._buffer_cur].tobytes()
+        return self._buffer_view[start:min(start + size, self._buffer_cur)].tobytes()
+
+    def _read_stream(self, size: 'int', /) -> 'bytes':
+        # read ``size`` bytes from the raw stream, until EOF if the
+        # raw stream returns less than requested
+        buf = self._stream.read(size)
+        if size < 0 or not buf:
+            return buf or b''
+
+        buf_tmp = buf
+        while buf_tmp and len(buf) < size:
+            buf_tmp = self._stream.read(size - len(buf))
+            if buf_tmp:
+                buf += buf_tmp
+        return buf
+
     def close(self) -> 'None':
         """Flush and close this stream. This method has no effect if the file is already closed.
         Once the file is closed, any operation on the file (e.g. reading or writing) will raise
@@ -161,6 +186,7 @@ class SeekableReader(io.BufferedReader):
             self._stream.close()
         if self._buffer_file is not None:
             self._buffer_file.close()
+        self._buffer_view.release()
         self._buffer.close()
 
         self._closed = True
@@ -204,11 +230,14 @@ class SeekableReader(io.BufferedReader):
             self._write_buffer(buf)
         else:
             if self._buffer_file is not None and self._tell < self._buffer_set:
+                self._buffer_file.flush()
                 with open(self._buffer_path, 'rb') as temp_file:
                     temp_file.seek(self._tell, io.SEEK_SET)
                     buf = temp_file.readline(size)
             else:
-                buf = self._buffer.readline(min(size, self._buffer_cur - 1))
+                buf = self._read_buffer(size)
+                if (buf_eol := buf.find(b'\n')) >= 0:
+                    buf = buf[:buf_eol + 1]
 
             if not buf.endswith(b'\n') and (size_rem := size - len(buf)) > 0:
                 buf_tmp = self._stream.readline(size_rem)
@@ -292,7 +321,7 @@ class SeekableReader(io.BufferedReader):
                 tmp_len = min(max(self._tell - tmp_end, self._buffer_size // 4), self._buffer_size)
                 self._tell = tmp_end
 
-                tmp_buf = self.read1(tmp_len)
+                tmp_buf = self.read(tmp_len)
                 self._tell = tmp_end + len(tmp_buf)
             self._buffer.seek(self._tell - self._buffer_set, io.SEEK_SET)
         else:
@@ -367,19 +396,20 @@ class SeekableReader(io.BufferedReader):
             size = -1
 
         if self._tell >= self._buffer_set + self._buffer_cur:
-            buf = self._stream.read(size)
+            buf = self._read_stream(size)
             self._write_buffer(buf)
         else:
             if self._buffer_file is not None and self._tell < self._buffer_set:
+                self._buffer_file.flush()
                 with open(self._buffer_path, 'rb') as temp_file:
                     temp_file.seek(self._tell, io.SEEK_SET)
                     buf = temp_file.read(size)
             else:
-                buf = self._buffer.read(min(size, self._buffer_cur - 1))
+                buf = self._read_buffer(size)
 
             size_rem = -1
             if size < 0 or (size_rem := size - len(buf)) > 0:
-                buf_tmp = self._stream.read(size_rem)
+                buf_tmp = self._read_stream(size_rem)
                 self._write_buffer(buf_tmp)
                 buf += buf_tmp
 
@@ -401,11 +431,12 @@ class SeekableReader(io.BufferedReader):
             self._write_buffer(buf)
         else:
             if self._buffer_file is not None and self._tell < self._buffer_set:
+                self._buffer_file.flush()
                 with open(self._buffer_path, 'rb') as temp_file:
                     temp_file.seek(self._tell, io.SEEK_SET)
                     buf = temp_file.read1(size)
             else:
-                buf = self._buffer.read1(min(size, self._buffer_cur - 1))
+                buf = self._read_buffer(size)
 
             if not buf:  # only if the buffer is empty
                 size_rem = -1
@@ -484,23 +515,126 @@ class SeekableReader(io.BufferedReader):
             if hasattr(self._stream, 'peek'):
                 buf = self._stream.peek(size)
             else:
-                buf = self._stream.read(size)
+                buf = self._stream.read(size if size > 0 else 1) or b''
                 self._write_buffer(buf)
         else:
             if self._buffer_file is not None and self._tell < self._buffer_set:
+                self._buffer_file.flush()
                 with open(self._buffer_path, 'rb') as temp_file:
                     temp_file.seek(self._tell, io.SEEK_SET)
                     buf = temp_file.peek(size)
             else:
-                buf = self._buffer.read(min(size, self._buffer_cur - 1))
-
-            if not buf and len(buf) < size:  # only if the buffer is empty and/or not enough
-                size_rem = -1
-                if size < 0 or (size_rem := size - len(buf)) > 0:
-                    if hasattr(self._stream, 'peek'):
-                        buf_tmp = self._stream.peek(size_rem)
-                    else:
-                        buf_tmp = self._stream.read(size_rem)
-                        self._write_buffer(buf_tmp)
-                        buf += buf_tmp
+                buf = self._read_buffer(size if size > 0 else -1)
         return buf
+
+
+class MemoryMappedReader(io.BufferedIOBase):
+    """Memory-mapped reader.
+
+    A read-only binary stream over a memory-mapped file. Reads are served
+    directly from the mapped pages, i.e., without the :func:`os.read` system
+    calls and the intermediate buffer copy of :class:`io.BufferedReader`.
+
+    Args:
+        name: Path name of the file to be mapped.
+
+    Raises:
+        ValueError: If the file is empty, which cannot be mapped.
+        OSError: If the file cannot be opened or mapped.
+
+    Notes:
+        The mapping is of the file size upon opening, thus the reader
+        does not apply to files still being written to.
+
+    """
+
+    if TYPE_CHECKING:
+        #: Underlying file object.
+        _file: 'IO[bytes]'
+        #: Memory-mapped file.
+        _mmap: 'mmap.mmap'
+
+        #: Path name of the file.
+        name: 'str'
+
+    @property
+    def closed(self) -> 'bool':
+        """:data:`True` if the stream is closed."""
+        return self._mmap.closed
+
+    def __init__(self, name: 'str') -> 'None':
+        super().__init__()
+
+        self.name = name
+        self._file = open(name, 'rb', buffering=0)  # pylint: disable=consider-using-with
+        try:
+            self._mmap = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+        except BaseException:
+            self._file.close()
+            raise
+
+        if hasattr(mmap, 'MADV_SEQUENTIAL'):
+            self._mmap.madvise(mmap.MADV_SEQUENTIAL)
+
+    def close(self) -> 'None':
+        """Flush and close this stream."""
+        if not self._mmap.closed:
+            self._mmap.close()
+            self._file.close()
+        super().close()
+
+    def fileno(self) -> 'int':
+        """Return the underlying file descriptor (an integer) of the stream if it exists."""
+        return self._file.fileno()
+
+    def madvise(self, option: 'int', start: 'int' = 0, length: 'Optional[int]' = None) -> 'None':
+        """Send advice ``option`` to the kernel about the mapped region beginning
+        at ``start`` and extending ``length`` bytes, c.f. :meth:`mmap.mmap.madvise`."""
+        if length is None:
+            length = len(self._mmap) - start
+        self._mmap.madvise(option, start, length)
+
+    def readable(self) -> 'bool':
+        """Return :data:`True` if the stream can be read from."""
+        return True
+
+    def seekable(self) -> 'bool':
+        """Return :data:`True` if the stream supports random access."""
+        return True
+
+    def seek(self, offset: 'int', whence: 'int' = io.SEEK_SET, /) -> 'int':
+        """Change the stream position to the given byte ``offset`` and return the new
+        absolute position."""
+        self._mmap.seek(offset, whence)
+        return self._mmap.tell()
+
+    def tell(self) -> 'int':
+        """Return the current stream position."""
+        return self._mmap.tell()
+
+    def read(self, size: 'int | None' = -1, /) -> 'bytes':
+        """Read and return ``size`` bytes, or if ``size`` is not given or negative, until EOF."""
+        if size is None:
+            size = -1
+        return self._mmap.read(size)
+
+    read1 = read
+
+    def readinto(self, b: 'Buffer', /) -> 'int':
+        """Read bytes into a pre-allocated, writable :term:`bytes-like object` ``b`` and return the
+        number of bytes read."""
+        if TYPE_CHECKING:
+            b = cast('memoryview', b)
+
+        buf = self._mmap.read(len(b))
+        buf_len = len(buf)
+
+        b[:buf_len] = buf
+        return buf_len
+
+    readinto1 = readinto
+
+    def peek(self, size: 'int' = 0) -> 'bytes':
+        """Return bytes from the stream without advancing the position."""
+        pos = self._mmap.tell()
+        return self._mmap[pos:pos + max(size, 1)]
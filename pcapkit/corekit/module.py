@@ -10,17 +10,30 @@ which is originally designed as :obj:`tuple[str, str] <tuple>`.
 
 """
 import collections
+import functools
 import importlib
 from typing import TYPE_CHECKING, Generic, TypeVar
 
 __all__ = ['ModuleDescriptor']
 
 if TYPE_CHECKING:
-    from typing import Type
+    from typing import Any, Type
 
 T = TypeVar('T')
 
 
+@functools.lru_cache(maxsize=None)
+def _import_class(module: 'str', name: 'str') -> 'Type[Any]':
+    """Import and cache class from module.
+
+    Args:
+        module: Module name.
+        name: Class name.
+
+    """
+    return getattr(importlib.import_module(module), name)
+
+
 class ModuleDescriptor(collections.namedtuple('ModuleDescriptor', ['module', 'name']), Generic[T]):
     """Module descriptor contains module name and class name, the actual
     class can be imported by ``from module import name``."""
@@ -35,5 +48,4 @@ class ModuleDescriptor(collections.namedtuple('ModuleDescriptor', ['module', 'na
     @property
     def klass(self) -> 'Type[T]':
         """Import class from module."""
-        module = importlib.import_module(self.module)
-        return getattr(module, self.name)
+        return _import_class(self.module, self.name)
@@ -575,8 +575,17 @@ class OrderedMultiDict(MultiDict[_KT, _VT]):
         raise UnsupportedCall('setlistdefault is unsupported for ordered multi dicts')
 
     def update(self, mapping: 'Mapping[_KT, _VT] | Iterable[tuple[_KT, _VT]]') -> 'None':  # type: ignore[override]
-        for key, value in iter_multi_items(mapping):
-            OrderedMultiDict.add(self, key, value)
+        # NOTE: a list/tuple of ``(key, value)`` pairs is consumed directly,
+        # and buckets are created in place, i.e., same as :meth:`add` but
+        # without the per-item method call overhead
+        if isinstance(mapping, (list, tuple)):
+            items = mapping  # type: Iterable[tuple[_KT, _VT]]
+        else:
+            items = iter_multi_items(mapping)
+
+        setdefault = dict.setdefault
+        for key, value in items:
+            setdefault(self, key, []).append(_omd_bucket(self, key, value))  # type: ignore[arg-type,attr-defined]
 
     def poplist(self, key: '_KT') -> 'list[_VT]':
         buckets = dict.pop(self, key, [])  # type: list[_omd_bucket[_KT, _VT]]
@@ -9,7 +9,8 @@
 in :mod:`dictdumper`.
 
 """
+from pcapkit.dumpkit.json import OrJSON
 from pcapkit.dumpkit.null import NotImplementedIO
 from pcapkit.dumpkit.pcap import PCAPIO
 
-__all__ = ['PCAPIO', 'NotImplementedIO']
+__all__ = ['PCAPIO', 'OrJSON', 'NotImplementedIO']
@@ -0,0 +1,129 @@
+# -*- coding: utf-8 -*-
+"""JSON Dumper
+=================
+
+.. module:: pcapkit.dumpkit.json
+
+:mod:`pcapkit.dumpkit.json` is the dumper for :mod:`pcapkit` implementation,
+specifically for JSON format with :mod:`orjson` as the serialisation
+backend, which is alike those described in :mod:`dictdumper`.
+
+Notes:
+   This dumper is **not** used by default, as its output is laid out
+   differently from :class:`dictdumper.JSON`, i.e., the dumped contents are
+   the same, only without the whitespace indentations. To opt in, register
+   it for the ``json`` output format, e.g.:
+
+   .. code-block:: python
+
+      from pcapkit.corekit.module import ModuleDescriptor
+      from pcapkit.foundation.extraction import Extractor
+
+      Extractor.register_dumper('json', ModuleDescriptor('pcapkit.dumpkit', 'OrJSON'), '.json')
+
+   Content blocks which :mod:`orjson` cannot serialise (e.g., integers
+   beyond 64-bit) or which contain non-ASCII characters fall back to
+   :func:`json.dumps`.
+
+"""
+import json
+import math
+import os
+from typing import TYPE_CHECKING
+
+import dictdumper
+
+from pcapkit.utilities.logging import logger
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+if TYPE_CHECKING:
+    from typing import IO, Any
+
+__all__ = ['OrJSON']
+
+
+class OrJSON(dictdumper.JSON):
+    """JSON file dumper using :mod:`orjson`.
+
+    The contents are first converted to JSON-native types following the
+    same conversion rules as :class:`dictdumper.JSON`, then serialised by
+    :func:`orjson.dumps` in one pass per content block.
+
+    """
+
+    ##########################################################################
+    # Utilities.
+    ##########################################################################
+
+    def _append_value(self, value: 'dict[str, Any]', file: 'IO[str]', name: 'str') -> 'None':
+        """Call this function to write contents.
+
+        Args:
+            value: content to be dumped
+            file: output file
+            name: name of current content block
+
+        """
+        cmma = ',\n' if self._vctr[self._tctr] else ''
+        file.seek(self._sptr, os.SEEK_SET)
+        file.write(f'{cmma}\t"{name}": ')
+        self._vctr[self._tctr] += 1
+
+        # NOTE: as with dictdumper.JSON, the content block itself is not
+        # encoded, i.e., its items are dumped as is
+        content = {str(key): self._convert(val) for key, val in value.items()}
+        try:
+            data = orjson.dumps(content)
+        except orjson.JSONEncodeError:  # e.g., integers beyond 64-bit
+            data = b''
+
+        # NOTE: as with dictdumper.JSON, we keep the output file in ASCII
+        if data and data.isascii():
+            file.write(data.decode())
+        else:
+            file.write(json.dumps(content, separators=(',', ':')))
+
+    def _convert(self, o: 'Any') -> 'Any':
+        """Convert content to JSON-native types.
+
+        Args:
+            o: object to convert
+
+        Returns:
+            Converted object, as would be written by
+            the corresponding ``_append_*`` method.
+
+        """
+        value = self._encode_value(o)
+        for (kind, code) in self.__type__:
+            if isinstance(value, kind):
+                break
+        else:
+            code = self.default(value)
+
+        if code == 'object':
+            return {str(key): self._convert(val) for key, val in value.items()}
+        if code == 'array':
+            return [self._convert(item) for item in value]
+        if code == 'string':
+            return str(value)
+        if code == 'date':
+            return value.isoformat()
+        if code == 'number':
+            if math.isnan(value):
+                return self._convert(self.make_object(value, None, number=str(value).replace('nan', 'NaN')))
+            if math.isinf(value):
+                return self._convert(self.make_object(value, None, number=str(value).replace('inf', 'Infinity')))
+            return value
+        if code == 'fallback':  # c.f. pcapkit.dumpkit.common.make_dumper
+            if hasattr(value, '__slots__'):
+                return self._convert({key: getattr(value, key) for key in value.__slots__})
+            if hasattr(value, '__dict__'):
+                return self._convert(vars(value))
+            logger.warning('unsupported object type: %s', type(value))
+            return str(value)
+        return value
@@ -142,11 +142,12 @@ class DPKT(Engine['DPKTPacket']):
 
         # verbose output
         ext._frnum += 1
-        ext._vfunc(ext, packet)
+        if ext._flag_v:
+            ext._vfunc(ext, packet)
 
         # write plist
-        frnum = f'Frame {ext._frnum}'
         if not ext._flag_q:
+            frnum = f'Frame {ext._frnum}'
             info = packet2dict(packet, timestamp, data_link=linktype)
             if ext._flag_f:
                 ofile = ext._ofile(f'{ext._ofnm}/{frnum}.{ext._fext}')
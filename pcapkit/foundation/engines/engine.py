@@ -142,6 +142,20 @@ class EngineBase(Generic[T], metaclass=EngineMeta):
 
         """
 
+    def read_frame_or_none(self) -> 'Optional[T]':
+        """Read frame, or return :obj:`None` upon EOF.
+
+        This method calls :meth:`read_frame` and converts the
+        :exc:`EOFError` (or :exc:`StopIteration` from third-party
+        readers) upon EOF into a :obj:`None` sentinel. Engines may
+        override it to detect EOF without raising exceptions.
+
+        """
+        try:
+            return self.read_frame()
+        except (EOFError, StopIteration):
+            return None
+
     def close(self) -> 'None':
         """Close engine.
 
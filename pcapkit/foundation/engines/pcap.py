@@ -8,15 +8,21 @@ This module contains the implementation for PCAP file extraction
 support, as is used by :class:`pcapkit.foundation.extraction.Extractor`.
 
 """
+import functools
 from typing import TYPE_CHECKING
 
+from pcapkit.corekit.io import SeekableReader
 from pcapkit.foundation.engines.engine import EngineBase as Engine
 from pcapkit.protocols.misc.pcap.frame import Frame
 from pcapkit.protocols.misc.pcap.header import Header
+from pcapkit.toolkit.pcap import (ipv4_reassembly, ipv6_reassembly, tcp_reassembly,
+                                 tcp_traceflow)
 
 __all__ = ['PCAP']
 
 if TYPE_CHECKING:
+    from typing import Callable, Optional
+
     from pcapkit.const.reg.linktype import LinkType as Enum_LinkType
     from pcapkit.corekit.version import VersionInfo
 
@@ -38,6 +44,8 @@ class PCAP(Engine[Frame]):
         _dlink: 'Enum_LinkType'
         #: Nanosecond flag.
         _nnsec: 'bool'
+        #: Frame constructor specialised for current file.
+        _frctr: 'Callable[..., Frame]'
 
     MAGIC_NUMBER = (
         b'\xa1\xb2\x3c\x4d',
@@ -110,6 +118,12 @@ class PCAP(Engine[Frame]):
         self._dlink = self._gbhdr.protocol
         self._nnsec = self._gbhdr.nanosecond
 
+        # NOTE: the global header and extraction settings are fixed for the
+        # whole file, so we bind them to the frame constructor once here
+        # rather than looking them up again upon every frame
+        self._frctr = functools.partial(Frame, header=self._gbhdr.info, layer=ext._exlyr,
+                                        protocol=ext._exptl, nanosecond=self._nnsec)
+
         if ext._flag_q:
             return
 
@@ -137,21 +151,19 @@ class PCAP(Engine[Frame]):
             Parsed frame instance.
 
         """
-        from pcapkit.toolkit.pcap import (ipv4_reassembly, ipv6_reassembly, tcp_reassembly,
-                                          tcp_traceflow)
         ext = self._extractor
 
         # read frame header
-        frame = Frame(ext._ifile, num=ext._frnum+1, header=self._gbhdr.info,
-                      layer=ext._exlyr, protocol=ext._exptl, nanosecond=self._nnsec)
+        frame = self._frctr(ext._ifile, num=ext._frnum+1)
         ext._frnum += 1
 
         # verbose output
-        ext._vfunc(ext, frame)
+        if ext._flag_v:
+            ext._vfunc(ext, frame)
 
         # write plist
-        frnum = f'Frame {ext._frnum}'
         if not ext._flag_q:
+            frnum = f'Frame {ext._frnum}'
             if ext._flag_f:
                 ofile = ext._ofile(f'{ext._ofnm}/{frnum}.{ext._fext}')
                 ofile(frame.info.to_dict(), name=frnum)
@@ -183,6 +195,30 @@ class PCAP(Engine[Frame]):
         # record frames
         if ext._flag_d:
             ext._frame.append(frame)
+        elif ext._flag_c:
+            frame_info = frame.info.frame_info
+            ext._frame_cols['timestamp'].append(
+                frame_info.ts_sec * 1_000_000_000 + frame_info.ts_usec * (1 if self._nnsec else 1_000)
+            )
+            ext._frame_cols['captured_len'].append(frame_info.incl_len)
+            ext._frame_cols['original_len'].append(frame_info.orig_len)
 
         # return frame record
         return frame
+
+    def read_frame_or_none(self) -> 'Optional[Frame]':
+        """Read frame, or return :obj:`None` upon EOF.
+
+        If the input file supports :meth:`~io.BufferedReader.peek` (except for
+        :class:`~pcapkit.corekit.io.SeekableReader`, whose buffer is not to be
+        disturbed), EOF is detected before parsing the next frame, without
+        raising and catching :exc:`EOFError`.
+
+        Returns:
+            Parsed frame instance, or :obj:`None` if EOF reached.
+
+        """
+        ifile = self._extractor._ifile
+        if not isinstance(ifile, SeekableReader) and hasattr(ifile, 'peek') and not ifile.peek(1):
+            return None
+        return super().read_frame_or_none()
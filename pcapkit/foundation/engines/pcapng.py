@@ -13,14 +13,19 @@ from typing import TYPE_CHECKING, cast
 
 from pcapkit.const.pcapng.block_type import BlockType as Enum_BlockType
 from pcapkit.corekit.infoclass import Info, info_final
+from pcapkit.corekit.io import SeekableReader
 from pcapkit.foundation.engines.engine import EngineBase as Engine
 from pcapkit.protocols.misc.pcapng import PCAPNG as P_PCAPNG
+from pcapkit.toolkit.pcapng import (ipv4_reassembly, ipv6_reassembly, tcp_reassembly,
+                                   tcp_traceflow)
 from pcapkit.utilities.exceptions import FormatError, stacklevel
 from pcapkit.utilities.warnings import DeprecatedFormatWarning
 
 __all__ = ['PCAPNG']
 
 if TYPE_CHECKING:
+    from typing import Optional
+
     from pcapkit.foundation.extraction import Extractor
     from pcapkit.protocols.data.misc.pcapng import PCAPNG as Data_PCAPNG
     from pcapkit.protocols.data.misc.pcapng import CustomBlock as Data_CustomBlock
@@ -160,8 +165,6 @@ class PCAPNG(Engine[P_PCAPNG]):
             Parsed PCAP-NG block.
 
         """
-        from pcapkit.toolkit.pcapng import (ipv4_reassembly, ipv6_reassembly, tcp_reassembly,
-                                            tcp_traceflow)
         ext = self._extractor
 
         while True:
@@ -237,7 +240,8 @@ class PCAPNG(Engine[P_PCAPNG]):
         ext._frnum += 1
 
         # verbose output
-        ext._vfunc(ext, block)
+        if ext._flag_v:
+            ext._vfunc(ext, block)
 
         # write plist
         self._write_file(block.info, name=f'Frame {ext._frnum}')
@@ -267,10 +271,32 @@ class PCAPNG(Engine[P_PCAPNG]):
         # record blocks
         if ext._flag_d:
             ext._frame.append(block)
+        elif ext._flag_c:
+            block_info = cast('Data_EnhancedPacketBlock', block.info)
+            ext._frame_cols['timestamp'].append(int(block_info.timestamp_epoch * 1_000_000_000))
+            ext._frame_cols['captured_len'].append(block_info.captured_len)
+            ext._frame_cols['original_len'].append(block_info.original_len)
 
         # return block record
         return block
 
+    def read_frame_or_none(self) -> 'Optional[P_PCAPNG]':
+        """Read frame, or return :obj:`None` upon EOF.
+
+        If the input file supports :meth:`~io.BufferedReader.peek` (except for
+        :class:`~pcapkit.corekit.io.SeekableReader`, whose buffer is not to be
+        disturbed), EOF is detected before parsing the next block, without
+        raising and catching :exc:`EOFError`.
+
+        Returns:
+            Parsed PCAP-NG block, or :obj:`None` if EOF reached.
+
+        """
+        ifile = self._extractor._ifile
+        if not isinstance(ifile, SeekableReader) and hasattr(ifile, 'peek') and not ifile.peek(1):
+            return None
+        return super().read_frame_or_none()
+
     ##########################################################################
     # Utilities.
     ##########################################################################
@@ -127,11 +127,12 @@ class PyShark(Engine['PySharkPacket']):
 
         # verbose output
         ext._frnum = int(packet.number)
-        ext._vfunc(ext, packet)
+        if ext._flag_v:
+            ext._vfunc(ext, packet)
 
         # write plist
-        frnum = f'Frame {ext._frnum}'
         if not ext._flag_q:
+            frnum = f'Frame {ext._frnum}'
             info = packet2dict(packet)
             if ext._flag_f:
                 ofile = ext._ofile(f'{ext._ofnm}/{frnum}.{ext._fext}')
@@ -117,11 +117,12 @@ class Scapy(Engine['ScapyPacket']):
 
         # verbose output
         ext._frnum += 1
-        ext._vfunc(ext, packet)
+        if ext._flag_v:
+            ext._vfunc(ext, packet)
 
         # write plist
-        frnum = f'Frame {ext._frnum}'
         if not ext._flag_q:
+            frnum = f'Frame {ext._frnum}'
             info = packet2dict(packet)
             if ext._flag_f:
                 ofile = ext._ofile(f'{ext._ofnm}/{frnum}.{ext._fext}')
@@ -13,16 +13,20 @@ coordinates information exchange in all network layers,
 extracts parametres from a PCAP file.
 
 """
-import collections
+import array
+import concurrent.futures
+import functools
 import importlib
 import io
+import mmap
 import os
+import stat
 import sys
 from typing import TYPE_CHECKING, Generic, TypeVar, cast
 
 from dictdumper.dumper import Dumper
 
-from pcapkit.corekit.io import SeekableReader
+from pcapkit.corekit.io import MemoryMappedReader, SeekableReader
 from pcapkit.corekit.module import ModuleDescriptor
 from pcapkit.dumpkit.common import make_dumper
 from pcapkit.foundation.engines.engine import Engine
@@ -41,9 +45,10 @@ from pcapkit.utilities.warnings import (EngineWarning, ExtractionWarning, Format
                                         RegistryWarning, warn)
 
 if TYPE_CHECKING:
-    from io import BufferedReader
+    from io import BufferedReader, RawIOBase
+    from os import PathLike
     from types import ModuleType, TracebackType
-    from typing import IO, Any, Callable, DefaultDict, Optional, Type, Union
+    from typing import IO, Any, Callable, Iterable, Optional, Type, Union
 
     from dpkt.dpkt import Packet as DPKTPacket
     from pyshark.packet.packet import Packet as PySharkPacket
@@ -71,6 +76,81 @@ __all__ = ['Extractor']
 
 P = TypeVar('P')
 
+#: Fallback dumper for unknown output formats.
+_DEFAULT_OUTPUT = (ModuleDescriptor('pcapkit.dumpkit', 'NotImplementedIO'), None)  # type: tuple[ModuleDescriptor[Dumper], None]
+
+#: Mapping of magic numbers to default extraction engines.
+_MAGIC_TABLE = {
+    **{magic: PCAP_Engine for magic in PCAP_Engine.MAGIC_NUMBER},
+    **{magic: PCAPNG_Engine for magic in PCAPNG_Engine.MAGIC_NUMBER},
+}  # type: dict[bytes, Type[PCAP_Engine] | Type[PCAPNG_Engine]]
+
+#: Default buffer size (in bytes) for reading input files, which can be
+#: overridden by the ``PCAPKIT_READ_BUFSIZE`` environment variable.
+try:
+    _BUFFER_SIZE = int(os.environ.get('PCAPKIT_READ_BUFSIZE', 1 << 20))
+except ValueError:
+    _BUFFER_SIZE = 1 << 20
+
+#: Maximum size (in bytes) of non-seekable input which will be read into
+#: memory at once rather than wrapped with :class:`~pcapkit.corekit.io.SeekableReader`,
+#: which can be overridden by the ``PCAPKIT_SMALL_INPUT_SIZE`` environment variable.
+try:
+    _SMALL_INPUT_SIZE = int(os.environ.get('PCAPKIT_SMALL_INPUT_SIZE', 64 << 20))
+except ValueError:
+    _SMALL_INPUT_SIZE = 64 << 20
+
+#: Size of consumed input (in bytes) after which its page cache is dropped
+#: under streaming-only extraction, c.f. :meth:`Extractor.record_frames`.
+_DONTNEED_SIZE = 1 << 23
+#: Mask to align input offsets to page boundaries, c.f. :data:`mmap.PAGESIZE`.
+_PAGE_MASK = ~(mmap.PAGESIZE - 1)
+
+#: Canonical names of extraction layers.
+_LAYERS = frozenset({'link', 'internet', 'transport', 'application', 'none'})
+
+#: Canonical names of extraction engines.
+_ENGINES = frozenset({'default', 'pcapkit', 'dpkt', 'scapy', 'pyshark'})
+
+#: Cached results of :meth:`Extractor.import_test`, keyed by module name.
+_IMPORT_CACHE = {}  # type: dict[str, Optional[ModuleType]]
+#: Names of engines which have been warned about as not available.
+_ENGINE_WARNED = set()  # type: set[str]
+
+
+def _verbose_handler(ext: 'Extractor', frame: 'Packet') -> 'None':
+    """Default verbose callback, i.e., print the frame number and protocol chain.
+
+    Args:
+        ext: Extractor instance.
+        frame: Parsed frame.
+
+    """
+    sys.stdout.write('Frame %3d: %s\n' % (ext._frnum, frame.protochain))  # pylint: disable=protected-access,consider-using-f-string
+
+
+def _run_one(cls: 'Type[Extractor]', fin: 'str', *,
+             kwargs: 'dict[str, Any]') -> 'tuple[str, Optional[tuple[Packet, ...]], Optional[ReassemblyData], Optional[TraceFlowData]]':  # pylint: disable=line-too-long
+    """Extract a single PCAP file for :meth:`Extractor.run_many`.
+
+    Args:
+        cls: Extractor class.
+        fin: Input file name.
+        kwargs: Keyword arguments for the extractor.
+
+    Returns:
+        Extraction results of the input file.
+
+    """
+    # pylint: disable=protected-access
+    ext = cls(fin=fin, **kwargs)
+    return (
+        ext._ifnm,
+        ext.frame if ext._flag_d else None,
+        ext.reassembly if ext._flag_r else None,
+        ext.trace if ext._flag_t else None,
+    )
+
 
 class Extractor(Generic[P]):
     """Extractor for PCAP files.
@@ -94,6 +174,9 @@ class Extractor(Generic[P]):
         #: Store data flag. It indicates if the extracted frames should be
         #: stored in memory.
         _flag_d: 'bool'
+        #: Store columns flag. It indicates if the extracted frames should be
+        #: stored in memory as columnar arrays of frame metadata.
+        _flag_c: 'bool'
         #: EOF flag. It indicates if the EOF is reached.
         _flag_e: 'bool'
         #: Split file flag, i.e. dump each frame into different files.
@@ -121,6 +204,9 @@ class Extractor(Generic[P]):
         _frnum: 'int'
         #: Frame records.
         _frame: 'list[Packet]'
+        #: Frame records in columns, i.e., timestamp (in nanoseconds),
+        #: captured length and original length of each frame.
+        _frame_cols: 'dict[str, array.array[int]]'
 
         #: Frame record for reassembly.
         _reasm: 'ReassemblyManager'
@@ -148,6 +234,8 @@ class Extractor(Generic[P]):
 
         #: Input file object.
         _ifile: 'BufferedReader'
+        #: Callback to close the input file object (if necessary) upon cleanup.
+        _ifile_close: 'Callable[[], None]'
         #: Output file object.
         _ofile: 'Dumper | Type[Dumper]'
 
@@ -166,19 +254,17 @@ class Extractor(Generic[P]):
     #: Format dumper mapping for writing output files. The values should be a
     #: tuple representing the module name and class name, or a
     #: :class:`dictdumper.dumper.Dumper` subclass, and corresponding file extension.
-    __output__ = collections.defaultdict(
-        lambda: (ModuleDescriptor('pcapkit.dumpkit', 'NotImplementedIO'), None),
-        {
-            'pcap': (ModuleDescriptor('pcapkit.dumpkit', 'PCAPIO'), '.pcap'),
-            'cap': (ModuleDescriptor('pcapkit.dumpkit', 'PCAPIO'), '.pcap'),
-            'plist': (ModuleDescriptor('dictdumper', 'PLIST'), '.plist'),
-            'xml': (ModuleDescriptor('dictdumper', 'PLIST'), '.plist'),
-            'json': (ModuleDescriptor('dictdumper', 'JSON'), '.json'),
-            'tree': (ModuleDescriptor('dictdumper', 'Tree'), '.txt'),
-            'text': (ModuleDescriptor('dictdumper', 'Text'), '.txt'),
-            'txt': (ModuleDescriptor('dictdumper', 'Tree'), '.txt'),
-        },
-    )  # type: DefaultDict[str, tuple[ModuleDescriptor[Dumper] | Type[Dumper], str | None]]
+    #: Unknown formats fall back to :data:`_DEFAULT_OUTPUT`.
+    __output__ = {
+        'pcap': (ModuleDescriptor('pcapkit.dumpkit', 'PCAPIO'), '.pcap'),
+        'cap': (ModuleDescriptor('pcapkit.dumpkit', 'PCAPIO'), '.pcap'),
+        'plist': (ModuleDescriptor('dictdumper', 'PLIST'), '.plist'),
+        'xml': (ModuleDescriptor('dictdumper', 'PLIST'), '.plist'),
+        'json': (ModuleDescriptor('dictdumper', 'JSON'), '.json'),
+        'tree': (ModuleDescriptor('dictdumper', 'Tree'), '.txt'),
+        'text': (ModuleDescriptor('dictdumper', 'Text'), '.txt'),
+        'txt': (ModuleDescriptor('dictdumper', 'Tree'), '.txt'),
+    }  # type: dict[str, tuple[ModuleDescriptor[Dumper] | Type[Dumper], str | None]]
 
     #: Engine mapping for extracting frames. The values should be a tuple representing
     #: the module name and class name, or an :class:`~pcapkit.foundation.engines.engine.Engine`
@@ -258,6 +344,23 @@ class Extractor(Generic[P]):
             return tuple(self._frame)
         raise UnsupportedCall("'Extractor(store=False)' object has no attribute 'frame'")
 
+    @property
+    def frame_columns(self) -> 'dict[str, array.array[int]]':
+        """Extracted frame metadata in columns.
+
+        * ``timestamp`` -- timestamp of each frame in nanoseconds (``Q`` array)
+        * ``captured_len`` -- captured length of each frame (``I`` array)
+        * ``original_len`` -- original length of each frame (``I`` array)
+
+        Raises:
+            UnsupportedCall: If :attr:`self._flag_c <pcapkit.foundation.extraction.Extractor._flag_c>`
+                is :data:`False`, as storing frame columns is disabled.
+
+        """
+        if self._flag_c:
+            return self._frame_cols
+        raise UnsupportedCall(f"'Extractor(store={self._flag_d})' object has no attribute 'frame_columns'")
+
     @property
     def reassembly(self) -> 'ReassemblyData':
         """Frame record for reassembly.
@@ -273,9 +376,9 @@ class Extractor(Generic[P]):
         """
         if self._flag_r:
             data = ReassemblyData(
-                ipv4=tuple(self._reasm.ipv4.datagram) if self._ipv4 else None,
-                ipv6=tuple(self._reasm.ipv6.datagram) if self._ipv6 else None,
-                tcp=tuple(self._reasm.tcp.datagram) if self._tcp else None,
+                ipv4=self._reasm.ipv4.datagram if self._ipv4 else None,
+                ipv6=self._reasm.ipv6.datagram if self._ipv6 else None,
+                tcp=self._reasm.tcp.datagram if self._tcp else None,
             )
             return data
         raise UnsupportedCall("'Extractor(reassembly=False)' object has no attribute 'reassembly'")
@@ -419,7 +522,8 @@ class Extractor(Generic[P]):
         Warns:
             pcapkit.utilities.warnings.EngineWarning: If the extraction engine is not
                 available. This is either due to dependency not installed, or supplied
-                engine unknown.
+                engine unknown. The warning is only emitted once per engine, i.e., the
+                fallback to default engine is silent for subsequent extractions.
 
         :rtype: None
         """
@@ -427,6 +531,7 @@ class Extractor(Generic[P]):
             eng = self.__engine__[self._exnam]
             if isinstance(eng, ModuleDescriptor):
                 eng = eng.klass
+                self.__engine__[self._exnam] = eng  # update mapping upon import
 
             if self.import_test(eng.module, name=eng.name) is not None:  # type: ignore[arg-type]
                 self._exeng = eng(self)
@@ -436,21 +541,23 @@ class Extractor(Generic[P]):
                 self.record_frames()
                 return
 
-            warn(f'engine {eng.name} (`{eng.module}`) is not installed; '
-                 'using default engine instead', EngineWarning, stacklevel=stacklevel())
+            if self._exnam not in _ENGINE_WARNED:  # only warn once per engine
+                warn(f'engine {eng.name} (`{eng.module}`) is not installed; '
+                     'using default engine instead', EngineWarning, stacklevel=stacklevel())
+                _ENGINE_WARNED.add(self._exnam)
             self._exnam = 'default'  # using default/pcapkit engine
 
         if self._exnam not in ('default', 'pcapkit'):
-            warn(f'unsupported extraction engine: {self._exnam}; '
-                 'using default engine instead', EngineWarning, stacklevel=stacklevel())
+            if self._exnam not in _ENGINE_WARNED:  # only warn once per engine
+                warn(f'unsupported extraction engine: {self._exnam}; '
+                     'using default engine instead', EngineWarning, stacklevel=stacklevel())
+                _ENGINE_WARNED.add(self._exnam)
             self._exnam = 'default'  # using default/pcapkit engine
 
-        if self._magic in PCAP_Engine.MAGIC_NUMBER:
-            self._exeng = cast('Engine[P]', PCAP_Engine(self))
-        elif self._magic in PCAPNG_Engine.MAGIC_NUMBER:
-            self._exeng = cast('Engine[P]', PCAPNG_Engine(self))
-        else:
+        eng_cls = _MAGIC_TABLE.get(self._magic)
+        if eng_cls is None:
             raise FormatError(f'unknown file format: {self._magic!r}')
+        self._exeng = cast('Engine[P]', eng_cls(self))
 
         # start engine
         self._exeng.run()
@@ -468,19 +575,73 @@ class Extractor(Generic[P]):
 
         Warns:
             pcapkit.utilities.warnings.EngineWarning: If the engine module is not installed.
+                As the test results are cached, the warning is only emitted upon the
+                first test of the engine module.
 
         Returns:
             If succeeded, returns the module; otherwise, returns :data:`None`.
 
         """
+        if engine in _IMPORT_CACHE:
+            return _IMPORT_CACHE[engine]
+
         try:
             module = importlib.import_module(engine)
         except ImportError:
             module = None
             warn(f"extraction engine '{name or engine}' not available; "
                  'using default engine instead', EngineWarning, stacklevel=stacklevel())
+        _IMPORT_CACHE[engine] = module
         return module
 
+    @classmethod
+    def run_many(cls, inputs: 'Iterable[str]', *, workers: 'Optional[int]' = None,
+                 **kwargs: 'Any') -> 'list[tuple[str, Optional[tuple[Packet, ...]], Optional[ReassemblyData], Optional[TraceFlowData]]]':  # pylint: disable=line-too-long
+        """Extract multiple PCAP files in parallel.
+
+        Each input file is extracted by a separate :class:`Extractor`
+        instance in a worker process of a :class:`~concurrent.futures.ProcessPoolExecutor`,
+        thus the extraction state (input file, reassembly and flow tracing
+        records) is never shared between workers.
+
+        Notes:
+            All keyword arguments are passed to each :class:`Extractor` instance
+            as is, therefore they must be picklable, e.g. a custom ``verbose``
+            callback must be a module-level function rather than a ``lambda``.
+
+            Unlike :class:`Extractor`, ``store`` and ``nofile`` default to
+            :data:`False` and :data:`True` respectively, since the extracted
+            frames are generally not picklable to be sent back from the
+            worker processes, and the output options would be shared among
+            all input files, i.e., every worker writes to the same ``fout``.
+
+        Args:
+            inputs: Input PCAP file names.
+            workers: Maximum number of worker processes, default to
+                :func:`os.cpu_count`.
+            **kwargs: Arbitrary keyword arguments for :class:`Extractor`.
+
+        Returns:
+            List of extraction results in the order of ``inputs``, each as
+            a tuple of input file name, extracted frames (if ``store=True``),
+            reassembly data (if ``reassembly=True``) and flow tracing data
+            (if ``trace=True``).
+
+        """
+        inputs = list(inputs)
+        kwargs.setdefault('store', False)
+        kwargs.setdefault('nofile', True)
+
+        if workers is None:
+            workers = os.cpu_count() or 1
+        if not inputs:
+            return []
+
+        chunksize = max(1, len(inputs) // (4 * workers))
+        with concurrent.futures.ProcessPoolExecutor(max_workers=workers) as executor:
+            return list(executor.map(functools.partial(_run_one, cls, kwargs=kwargs), inputs,
+                                     chunksize=chunksize))
+
     @classmethod
     def make_name(cls, fin: 'str | IO[bytes]' = 'in.pcap', fout: 'str' = 'out',
                   fmt: 'Formats' = 'tree', extension: 'bool' = True, *, files: 'bool' = False,
@@ -534,7 +695,11 @@ class Extractor(Generic[P]):
             else:
                 ifnm = fin
 
-            if not os.path.isfile(ifnm):
+            try:
+                ifmode = os.stat(ifnm).st_mode
+            except (OSError, ValueError):
+                ifmode = 0
+            if not stat.S_ISREG(ifmode):
                 raise FileNotFound(2, 'No such file or directory', ifnm)
         else:
             ifnm = fin.name
@@ -543,18 +708,19 @@ class Extractor(Generic[P]):
             ofnm = None
             ext = None
         else:
-            ext = cls.__output__[fmt][1]
+            ext = cls.__output__.get(fmt, _DEFAULT_OUTPUT)[1]
             if ext is None:
                 raise FormatError(f'unknown output format: {fmt}')
 
-            if (parent := os.path.split(fout)[0]):
+            parent, tail = os.path.split(fout)
+            if parent:
                 os.makedirs(parent, exist_ok=True)
 
             if files:
                 ofnm = fout
                 os.makedirs(ofnm, exist_ok=True)
             elif extension:
-                ofnm = fout if os.path.splitext(fout)[1] == ext else f'{fout}{ext}'
+                ofnm = fout if os.path.splitext(tail)[1] == ext else f'{fout}{ext}'
             else:
                 ofnm = fout
 
@@ -577,21 +743,15 @@ class Extractor(Generic[P]):
 
         """
         # pylint: disable=attribute-defined-outside-init,protected-access
-        if self._magic in PCAP_Engine.MAGIC_NUMBER:
-            engine = PCAP_Engine(self)
-            engine.run()
-
-            self._ifile.seek(0, os.SEEK_SET)
-            return engine  # type: ignore[return-value]
-
-        if self._magic in PCAPNG_Engine.MAGIC_NUMBER:
-            engine = PCAPNG_Engine(self)  # type: ignore[assignment]
-            engine.run()
+        eng_cls = _MAGIC_TABLE.get(self._magic)
+        if eng_cls is None:
+            raise FormatError(f'unknown file format: {self._magic!r}')
 
-            self._ifile.seek(0, os.SEEK_SET)
-            return engine  # type: ignore[return-value]
+        engine = eng_cls(self)
+        engine.run()
 
-        raise FormatError(f'unknown file format: {self._magic!r}')
+        self._ifile.seek(0, os.SEEK_SET)
+        return engine  # type: ignore[return-value]
 
     def record_frames(self) -> 'None':
         """Read packet frames.
@@ -605,51 +765,82 @@ class Extractor(Generic[P]):
             Under non-auto mode, i.e. :attr:`self._flag_a <Extractor._flag_a>` is
             :data:`False`, the method performs no action.
 
-        """
-        if self._flag_a:
-            while True:
-                try:
-                    self._exeng.read_frame()
-                except (EOFError, StopIteration):
-                    warn('EOF reached', ExtractionWarning, stacklevel=stacklevel())
+            Under no-EOF mode, i.e. :attr:`self._flag_n <Extractor._flag_n>` is
+            :data:`True`, the ``EOF reached`` warning is only emitted once.
 
-                    if self._flag_n:
-                        continue
-
-                    # quit when EOF
-                    break
-                except KeyboardInterrupt:
-                    self._cleanup()
-                    raise
+            Under streaming-only mode, i.e., the input is a file name and neither
+            file output nor frame storage is enabled, the consumed input is dropped
+            periodically, through :meth:`MemoryMappedReader.madvise <pcapkit.corekit.io.MemoryMappedReader.madvise>`
+            for memory-mapped input, or :func:`os.posix_fadvise` otherwise.
 
+        """
+        if not self._flag_a:
+            return
+
+        # streaming-only extraction, i.e., frames are neither stored nor dumped,
+        # hence the consumed input will not be read again and its pages can be
+        # dropped to avoid evicting other useful pages; mapped pages are not
+        # dropped by posix_fadvise, thus we unmap them through madvise instead
+        drop_pages = None  # type: Optional[Callable[[int, int], None]]
+        if self._flag_s and self._flag_q and not (self._flag_d or self._flag_c):
+            if isinstance(self._ifile, MemoryMappedReader):
+                if hasattr(mmap, 'MADV_DONTNEED'):
+                    drop_pages = functools.partial(self._ifile.madvise, mmap.MADV_DONTNEED)
+            elif hasattr(os, 'posix_fadvise'):
+                fd = self._ifile.fileno()
+                drop_pages = lambda start, length: os.posix_fadvise(fd, start, length, os.POSIX_FADV_DONTNEED)
+
+        read_frame = self._exeng.read_frame_or_none
+        try:
+            if drop_pages is not None:
+                done = 0
+                while read_frame() is not None:
+                    pos = self._ifile.tell() & _PAGE_MASK  # madvise requires page alignment
+                    if pos - done >= _DONTNEED_SIZE:
+                        drop_pages(done, pos - done)
+                        done = pos
+            else:
+                while read_frame() is not None:
+                    pass
+            warn('EOF reached', ExtractionWarning, stacklevel=stacklevel())
+
+            # keep polling for new frames when EOF; the warning
+            # is only emitted once for the first EOF reached
+            while self._flag_n:
+                read_frame()
+        except KeyboardInterrupt:
             self._cleanup()
+            raise
+
+        self._cleanup()
 
     ##########################################################################
     # Data models.
     ##########################################################################
 
     def __init__(self,
-                 fin: 'Optional[str | IO[bytes]]' = None, fout: 'Optional[str]' = None, format: 'Optional[Formats]' = None,     # basic settings # pylint: disable=redefined-builtin
-                 auto: 'bool' = True, extension: 'bool' = True, store: 'bool' = True,                                           # internal settings # pylint: disable=line-too-long
+                 fin: 'Optional[str | PathLike[str] | IO[bytes]]' = None, fout: 'Optional[str]' = None, format: 'Optional[Formats]' = None, # basic settings # pylint: disable=redefined-builtin
+                 auto: 'bool' = True, extension: 'bool' = True, store: 'bool | Literal["columns"]' = True,                      # internal settings # pylint: disable=line-too-long
                  files: 'bool' = False, nofile: 'bool' = False, verbose: 'bool | VerboseHandler' = False,                       # output settings # pylint: disable=line-too-long
                  engine: 'Optional[Engines]' = None, layer: 'Optional[Layers]' = None, protocol: 'Optional[Protocols]' = None,  # extraction settings # pylint: disable=line-too-long
                  reassembly: 'bool' = False, reasm_strict: 'bool' = True, reasm_store: 'bool' = True,                           # reassembly settings # pylint: disable=line-too-long
                  trace: 'bool' = False, trace_fout: 'Optional[str]' = None, trace_format: 'Optional[Formats]' = None,           # trace settings # pylint: disable=line-too-long
                  trace_byteorder: 'Literal["big", "little"]' = sys.byteorder, trace_nanosecond: 'bool' = False,                 # trace settings # pylint: disable=line-too-long
                  ip: 'bool' = False, ipv4: 'bool' = False, ipv6: 'bool' = False, tcp: 'bool' = False,                           # reassembly/trace settings # pylint: disable=line-too-long
-                 buffer_size: 'int' = io.DEFAULT_BUFFER_SIZE, buffer_save: 'bool' = False, buffer_path: 'Optional[str]' = None, # buffer settings # pylint: disable=line-too-long
+                 buffer_size: 'int' = _BUFFER_SIZE, buffer_save: 'bool' = False, buffer_path: 'Optional[str]' = None, # buffer settings # pylint: disable=line-too-long
                  no_eof: 'bool' = False) -> 'None':
         """Initialise PCAP Reader.
 
         Args:
-            fin: file name to be read or a binary IO object;
+            fin: file name (or path-like object) to be read or a binary IO object;
                 if file not exist, raise :exc:`FileNotFound`
             fout: file name to be written
             format: file format of output
 
             auto: if automatically run till EOF
             extension: if check and append extensions to output file
-            store: if store extracted packet info
+            store: if store extracted packet info; or ``'columns'`` to store
+                only the frame metadata as columnar arrays (for default engines only)
 
             files: if split each frame into different files
             nofile: if no output file is to be dumped
@@ -677,7 +868,9 @@ class Extractor(Generic[P]):
             tcp: if perform TCP reassembly and/or flow tracing
                 (must be used with ``reassembly=True`` or ``trace=True``)
 
-            buffer_size: buffer size for reading input file (for :class:`~pcapkit.corekit.io.SeekableReader` only)
+            buffer_size: buffer size for reading input file; default to 1 MiB, as sizes beyond
+                128 KiB bring little further improvement in read throughput, or the value of
+                the ``PCAPKIT_READ_BUFSIZE`` environment variable if set
             buffer_save: if save buffer to file (for :class:`~pcapkit.corekit.io.SeekableReader` only)
             buffer_path: path name for buffer file if necessary (for :class:`~pcapkit.corekit.io.SeekableReader` only)
 
@@ -692,6 +885,8 @@ class Extractor(Generic[P]):
         """
         if fin is None:
             fin = 'in.pcap'
+        elif isinstance(fin, os.PathLike):  # path-like objects are mapped as file names
+            fin = os.fsdecode(fin)
         if fout is None:
             fout = 'out'
         if format is None:
@@ -704,7 +899,8 @@ class Extractor(Generic[P]):
         self._fext = oext  # output file extension
 
         self._flag_a = auto                  # auto extract flag
-        self._flag_d = store                 # store data flag
+        self._flag_c = store == 'columns'    # store columns flag
+        self._flag_d = bool(store) and not self._flag_c  # store data flag
         self._flag_e = False                 # EOF flag
         self._flag_f = files                 # split file flag
         self._flag_q = nofile                # no output flag
@@ -718,25 +914,37 @@ class Extractor(Generic[P]):
         if isinstance(verbose, bool):
             self._flag_v = verbose
             if verbose:
-                self._vfunc = lambda e, f: print(
-                    f'Frame {e._frnum:>3d}: {f.protochain}'  # pylint: disable=protected-access
-                )  # pylint: disable=logging-fstring-interpolation
+                self._vfunc = _verbose_handler
             else:
-                self._vfunc = lambda e, f: None
+                self._vfunc = lambda e, f: None  # engines skip the callback if verbose flag unset
         else:
             self._flag_v = True
             self._vfunc = verbose
 
         self._frnum = 0   # frame number
         self._frame = []  # frame record
+        self._frame_cols = {
+            'timestamp': array.array('Q'),
+            'captured_len': array.array('I'),
+            'original_len': array.array('I'),
+        }  # frame record in columns
 
         self._ipv4 = ipv4 or ip  # IPv4 Reassembly
         self._ipv6 = ipv6 or ip  # IPv6 Reassembly
         self._tcp = tcp          # TCP Reassembly
 
-        self._exptl = protocol or 'null'                              # extract til protocol
-        self._exlyr = cast('Layers', (layer or 'none').lower())       # extract til layer
-        self._exnam = cast('Engines', (engine or 'default').lower())  # extract using engine
+        self._exptl = protocol or 'null'  # extract til protocol
+
+        # NOTE: canonical names are used as is to avoid unnecessary lowercasing
+        exlyr = layer or 'none'
+        if exlyr not in _LAYERS:
+            exlyr = exlyr.lower()
+        exnam = engine or 'default'
+        if exnam not in _ENGINES:
+            exnam = exnam.lower()
+
+        self._exlyr = cast('Layers', exlyr)   # extract til layer
+        self._exnam = cast('Engines', exnam)  # extract using engine
 
         if reassembly:
             reasm_obj_ipv4 = reasm_obj_ipv6 = reasm_obj_tcp = None
@@ -795,22 +1003,68 @@ class Extractor(Generic[P]):
             )
 
         if self._flag_s:
-            self._ifile = open(ifnm, 'rb')  # input file # pylint: disable=unspecified-encoding,consider-using-with
+            ifile = None  # type: Optional[BufferedReader]
+            if not no_eof:  # mapping is of fixed size, hence not for growing files
+                try:
+                    ifile = cast('BufferedReader', MemoryMappedReader(ifnm))
+                except (OSError, ValueError, OverflowError):  # empty file or mapping not supported
+                    pass
+
+            if ifile is None:
+                ifile = open(ifnm, 'rb', buffering=buffer_size)  # pylint: disable=unspecified-encoding,consider-using-with
+            self._ifile = ifile  # input file
+        elif isinstance(fin, io.RawIOBase):
+            self._ifile = io.BufferedReader(fin, buffer_size=buffer_size)
         else:
             self._ifile = cast('BufferedReader', fin)
 
+        # hint kernel readahead for sequential access, which also applies to
+        # file objects given by the caller; memory-mapped files are already
+        # advised upon mapping, and pipes, etc. are simply ignored
+        if hasattr(os, 'posix_fadvise') and not isinstance(self._ifile, MemoryMappedReader):
+            try:
+                os.posix_fadvise(self._ifile.fileno(), 0, 0, os.POSIX_FADV_SEQUENTIAL)
+            except (AttributeError, OSError, ValueError):  # no underlying file descriptor
+                pass
+
         if not self._ifile.seekable():
-            self._ifile = SeekableReader(self._ifile, buffer_size, buffer_save, buffer_path,
-                                         stream_closing=not self._flag_s)
+            # NOTE: small inputs of known size (e.g., regular files behind a
+            # non-seekable wrapper) are simply read into memory at once, as
+            # random access to a BytesIO is much cheaper than buffering through
+            # SeekableReader; inputs of unknown size (e.g., pipes) are not read
+            # ahead, since that would block until EOF on live captures
+            try:
+                fstat = os.fstat(self._ifile.fileno())
+                small_input = stat.S_ISREG(fstat.st_mode) and fstat.st_size <= _SMALL_INPUT_SIZE
+            except (AttributeError, OSError, ValueError):  # no underlying file descriptor
+                small_input = False
+
+            if small_input and not (no_eof or buffer_save):
+                ifile_data = self._ifile.read()
+                if not self._flag_s:
+                    self._ifile.close()
+                self._ifile = io.BufferedReader(cast('RawIOBase', io.BytesIO(ifile_data)),
+                                                buffer_size=buffer_size)
+            else:
+                self._ifile = SeekableReader(self._ifile, buffer_size, buffer_save, buffer_path,
+                                             stream_closing=not self._flag_s)
+
+        # NOTE: input files opened by ourselves are kept open upon cleanup,
+        # except for those wrapped by SeekableReader
+        if isinstance(self._ifile, SeekableReader) or not self._flag_s:
+            self._ifile_close = self._ifile.close
+        else:
+            self._ifile_close = lambda: None
 
         if not self._flag_q:
-            output, ext = self.__output__[fmt]
+            output, ext = self.__output__.get(fmt, _DEFAULT_OUTPUT)
             if ext is None:
                 warn(f'Unsupported output format: {fmt}; disabled file output feature',
                      FormatWarning, stacklevel=stacklevel())
             if isinstance(output, ModuleDescriptor):
                 output = output.klass
-                self.__output__[fmt] = (output, ext)  # update mapping upon import
+                if fmt in self.__output__:
+                    self.__output__[fmt] = (output, ext)  # update mapping upon import
             dumper = make_dumper(output)
 
             self._ofile = dumper if self._flag_f else dumper(ofnm)  # output file
@@ -844,11 +1098,14 @@ class Extractor(Generic[P]):
         then it calls :meth:`self._cleanup <_cleanup>` for the aftermath.
 
         """
+        eof_warned = False
         while True:
             try:
                 return self._exeng.read_frame()
             except (EOFError, StopIteration) as error:
-                warn('EOF reached', ExtractionWarning, stacklevel=stacklevel())
+                if not eof_warned:  # only warn once when polling under no-EOF mode
+                    warn('EOF reached', ExtractionWarning, stacklevel=stacklevel())
+                    eof_warned = True
 
                 if self._flag_n:
                     continue
@@ -868,11 +1125,14 @@ class Extractor(Generic[P]):
 
         """
         if not self._flag_a:
+            eof_warned = False
             while True:
                 try:
                     return self._exeng.read_frame()
                 except (EOFError, StopIteration):
-                    warn('EOF reached', ExtractionWarning, stacklevel=stacklevel())
+                    if not eof_warned:  # only warn once when polling under no-EOF mode
+                        warn('EOF reached', ExtractionWarning, stacklevel=stacklevel())
+                        eof_warned = True
 
                     if self._flag_n:
                         continue
@@ -903,13 +1163,13 @@ class Extractor(Generic[P]):
 
         The method calls :meth:`self._exeng.close <pcapkit.foundation.engines.engine.Engine.close>`,
         sets :attr:`self._flag_e <pcapkit.foundation.extraction.Extractor._flag_e>`
-        as :data:`True` and closes the input file (if necessary).
+        as :data:`True` and closes the input file (if necessary). It has no
+        effect if the cleanup has already been performed.
 
         """
         # pylint: disable=attribute-defined-outside-init
+        if self._flag_e:
+            return
         self._flag_e = True
-        if isinstance(self._ifile, SeekableReader):
-            self._ifile.close()
-        elif not self._flag_s:
-            self._ifile.close()
+        self._ifile_close()
         self._exeng.close()
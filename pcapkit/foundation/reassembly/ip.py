@@ -76,8 +76,9 @@ class IP(Reassembly[Packet[AT], Datagram[AT], BufferID, Buffer[AT]], Generic[AT]
                 return
 
         # initialise buffer with BUFID
-        if BUFID not in self._buffer:
-            self._buffer[BUFID] = Buffer(
+        buffer = self._buffer.get(BUFID)
+        if buffer is None:
+            buffer = self._buffer[BUFID] = Buffer(
                 TDL=-1,                              # Total Data Length
                 RCVBT=bytearray(8191),              # Fragment Received Bit Table
                 index=[],                           # index record
@@ -87,31 +88,31 @@ class IP(Reassembly[Packet[AT], Datagram[AT], BufferID, Buffer[AT]], Generic[AT]
         else:
             # put header into header buffer
             if not FO:  # pylint: disable=else-if-used
-                self._buffer[BUFID].__update__(header=info.header)
+                buffer.__update__(header=info.header)
 
         # append packet index
-        self._buffer[BUFID].index.append(info.num)
+        buffer.index.append(info.num)
 
         # put data into data buffer
         start = FO
         stop = TL - IHL + FO
-        self._buffer[BUFID].datagram[start:stop] = info.payload
+        buffer.datagram[start:stop] = info.payload
 
         # set RCVBT bits (in 8 octets)
         start = FO // 8
         stop = FO // 8 + (TL - IHL + 7) // 8
-        self._buffer[BUFID].RCVBT[start:stop] = b'\x01' * (stop - start + 1)
+        buffer.RCVBT[start:stop] = b'\x01' * (stop - start + 1)
 
         # get total data length (header excludes)
         TDL = 0
         if not MF:
             TDL = TL - IHL + FO
-            self._buffer[BUFID].__update__(TDL=TDL)
+            buffer.__update__(TDL=TDL)
 
         # when datagram is reassembled in whole
         start = 0
         stop = (TDL + 7) // 8
-        if TDL and all(self._buffer[BUFID].RCVBT[start:stop]):
+        if TDL and all(buffer.RCVBT[start:stop]):
             self._dtgram.extend(
                 self.submit(self._buffer.pop(BUFID), bufid=BUFID, checked=True)
             )
@@ -160,7 +160,15 @@ class ReassemblyBase(Generic[PT, DT, IT, BT], metaclass=ReassemblyMeta):
 
         if self._buffer:
             return self.fetch()
-        return tuple(self._dtgram)
+
+        # NOTE: datagrams are only ever appended to the storage, so the
+        # cached snapshot is valid as long as the length is unchanged
+        if (cached := self.__cached__.get('datagram')) is not None and len(cached) == len(self._dtgram):
+            return cached
+
+        ret = tuple(self._dtgram)
+        self.__cached__['datagram'] = ret
+        return ret
 
     ##########################################################################
     # Methods.
@@ -253,8 +261,9 @@ class ReassemblyBase(Generic[PT, DT, IT, BT], metaclass=ReassemblyMeta):
             packets: list of packet dicts to be reassembled
 
         """
+        reassembly = self.reassembly
         for packet in packets:
-            self.reassembly(packet)
+            reassembly(packet)
 
     # register callback function
     @classmethod
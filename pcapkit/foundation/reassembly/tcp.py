@@ -83,8 +83,13 @@ class TCP(Reassembly[Packet, Datagram, BufferID, Buffer]):
                 self.submit(self._buffer.pop(BUFID), bufid=BUFID)
             )
 
+        # NOTE: the buffer identifier contains IP address objects, whose hash
+        # values are computed at Python level and are not cached by tuples;
+        # hence we look up the buffer (and fragment) once for each packet
+        buffer = self._buffer.get(BUFID)
+
         # initialise buffer with BUFID & ACK
-        if BUFID not in self._buffer:
+        if buffer is None:
             self._buffer[BUFID] = Buffer(
                 hdl=[
                     HoleDiscriptor(
@@ -106,8 +111,9 @@ class TCP(Reassembly[Packet, Datagram, BufferID, Buffer]):
             )
         else:
             # initialise buffer with ACK
-            if ACK not in self._buffer[BUFID].ack:
-                self._buffer[BUFID].ack[ACK] = Fragment(
+            fragment = buffer.ack.get(ACK)
+            if fragment is None:
+                buffer.ack[ACK] = Fragment(
                     ind=[
                         info.num,
                     ],
@@ -118,16 +124,16 @@ class TCP(Reassembly[Packet, Datagram, BufferID, Buffer]):
             else:
                 # put header into header buffer
                 if SYN:
-                    self._buffer[BUFID].__update__(hdr=info.header)
+                    buffer.__update__(hdr=info.header)
 
                 # append packet index
-                self._buffer[BUFID].ack[ACK].ind.append(info.num)
+                fragment.ind.append(info.num)
 
                 # record fragment payload
-                ISN = self._buffer[BUFID].ack[ACK].isn       # Initial Sequence Number
-                RAW = self._buffer[BUFID].ack[ACK].raw       # Raw Payload Data
+                ISN = fragment.isn  # Initial Sequence Number
+                RAW = fragment.raw  # Raw Payload Data
                 if DSN >= ISN:  # if fragment goes after existing payload
-                    LEN = self._buffer[BUFID].ack[ACK].len
+                    LEN = fragment.len
                     GAP = DSN - (ISN + LEN)     # gap length between payloads
                     if GAP >= 0:    # if fragment goes after existing payload
                         RAW += bytearray(GAP) + info.payload
@@ -136,22 +142,22 @@ class TCP(Reassembly[Packet, Datagram, BufferID, Buffer]):
                 else:           # if fragment exceeds existing payload
                     LEN = info.len
                     GAP = ISN - (DSN + LEN)     # gap length between payloads
-                    self._buffer[BUFID].ack[ACK].__update__(
+                    fragment.__update__(
                         isn=DSN,
                     )
                     if GAP >= 0:    # if fragment exceeds existing payload
                         RAW = info.payload + bytearray(GAP) + RAW
                     else:           # if fragment partially overlaps existing payload
                         RAW = info.payload + RAW[ISN-GAP:]
-                #self._buffer[BUFID].ack[ACK].raw = RAW       # update payload datagram
-                #self._buffer[BUFID].ack[ACK].len = len(RAW)  # update payload length
-                self._buffer[BUFID].ack[ACK].__update__(
+                #fragment.raw = RAW       # update payload datagram
+                #fragment.len = len(RAW)  # update payload length
+                fragment.__update__(
                     raw=RAW,       # update payload datagram
                     len=len(RAW),  # update payload length
                 )
 
             # update hole descriptor list
-            HDL = self._buffer[BUFID].hdl                          # HDL alias
+            HDL = buffer.hdl                                       # HDL alias
             for (index, hole) in enumerate(HDL):                   # step one
                 if info.first > hole.last:                         # step two
                     continue
@@ -172,7 +178,7 @@ class TCP(Reassembly[Packet, Datagram, BufferID, Buffer]):
                     )
                     HDL.insert(index, new_hole)
                 break                                              # step seven
-            #self._buffer[BUFID].hdl = HDL                         # update HDL
+            #buffer.hdl = HDL                                      # update HDL
 
         # when FIN/RST is set, submit buffer of this session
         if FIN or RST:
@@ -76,10 +76,12 @@ class Buffer(Info):
     index: 'list[int]'
     #: Flow label generated from ``BUFID``.
     label: 'str'
+    #: Output filename if exists.
+    fpath: 'Optional[str]'
 
     if TYPE_CHECKING:
-        def __init__(self, fpout: 'Dumper',
-                     index: 'list[int]', label: 'str') -> 'None': ...  # pylint: disable=unused-argument,super-init-not-called,multiple-statements
+        def __init__(self, fpout: 'Dumper', index: 'list[int]',
+                     label: 'str', fpath: 'Optional[str]') -> 'None': ...  # pylint: disable=unused-argument,super-init-not-called,multiple-statements
 
 
 @info_final
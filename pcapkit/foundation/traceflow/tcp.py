@@ -103,31 +103,38 @@ class TCP(TraceFlow[BufferID, Buffer, Index, Packet[IPAddress]], Generic[IPAddre
         #     self._stream.append(Info(temp))
 
         # initialise buffer with BUFID
-        if BUFID not in self._buffer:
-            if packet.src.version == 4:
-                label = f'{packet.src}_{packet.srcport}-{packet.dst}_{packet.dstport}-{packet.timestamp}'
-            else:
-                label = f'{packet.src}_{packet.srcport}-{packet.dst}_{packet.dstport}-{packet.timestamp}'.replace(':', '.')
-            self._buffer[BUFID] = Buffer(
-                fpout=self._foutio(fname=f'{self._fproot}/{label}{self._fdpext or ""}', protocol=packet.protocol,
+        buffer = self._buffer.get(BUFID)
+        if buffer is None:
+            # NOTE: the flow label is only formatted upon the first packet of
+            # each flow, as it names the output file of the flow
+            label = f'{packet.src}_{packet.srcport}-{packet.dst}_{packet.dstport}-{packet.timestamp}'
+            if packet.src.version != 4:
+                label = label.replace(':', '.')
+            fname = f'{self._fproot}/{label}{self._fdpext or ""}'
+            buffer = self._buffer[BUFID] = Buffer(
+                fpout=self._foutio(fname=fname, protocol=packet.protocol,
                                    byteorder=self._endian, nanosecond=self._nnsecd),
                 index=[],
                 label=label,
+                fpath=fname if self._fdpext is not None else None,
             )
 
         # trace frame record
-        self._buffer[BUFID].index.append(packet.index)
-        fpout = self._buffer[BUFID].fpout
-        label = self._buffer[BUFID].label
+        buffer.index.append(packet.index)
+        fpout = buffer.fpout
+        label = buffer.label
 
         # when FIN is set, submit buffer of this session
         if FIN:
-            buf = self._buffer.pop(BUFID)
+            # NOTE: the buffer of this session is already at hand, so we
+            # simply drop it from the mapping without fetching it again
+            del self._buffer[BUFID]
+            self._opened.pop(BUFID, None)
             # fpout, label = buf['fpout'], buf['label']
 
             index = Index(
-                fpout=f'{self._fproot}/{label}{self._fdpext}' if self._fdpext is not None else None,
-                index=tuple(buf.index),
+                fpout=buffer.fpath,
+                index=tuple(buffer.index),
                 label=label,
             )
             for callback in self.__callback_fn__:
@@ -147,11 +154,16 @@ class TCP(TraceFlow[BufferID, Buffer, Index, Packet[IPAddress]], Generic[IPAddre
         if (cached := self.__cached__.get('submit')) is not None:
             return cached
 
+        # NOTE: frame indexes are only appended to buffers, hence the cached
+        # index of a flow is still valid if its length is not changed
         ret = []  # type: list[Index]
-        for buf in self._buffer.values():
-            ret.append(Index(fpout=f"{self._fproot}/{buf.label}{self._fdpext}" if self._fdpext else None,
-                             index=tuple(buf.index),
-                             label=buf.label,))
+        for (bufid, buf) in self._buffer.items():
+            index = self._opened.get(bufid)
+            if index is None or len(index.index) != len(buf.index):
+                index = self._opened[bufid] = Index(fpout=buf.fpath,
+                                                    index=tuple(buf.index),
+                                                    label=buf.label,)
+            ret.append(index)
         ret.extend(self._stream)
         ret_submit = tuple(ret)
 
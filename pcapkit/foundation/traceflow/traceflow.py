@@ -11,7 +11,6 @@ which is an abstract base class for all flow tracing classes.
 
 """
 import abc
-import collections
 import os
 import sys
 from typing import TYPE_CHECKING, Generic, TypeVar, cast, overload
@@ -28,7 +27,7 @@ from pcapkit.utilities.warnings import FileWarning, FormatWarning, RegistryWarni
 __all__ = ['TraceFlow']
 
 if TYPE_CHECKING:
-    from typing import Any, Callable, DefaultDict, Optional, Type
+    from typing import Any, Callable, Optional, Type
 
     from typing_extensions import Literal, Self
 
@@ -42,6 +41,9 @@ Buffer = TypeVar('Buffer', bound='Info')
 Index = TypeVar('Index', bound='Info')
 Packet = TypeVar('Packet', bound='Info')
 
+#: Fallback dumper for unknown output formats.
+_DEFAULT_OUTPUT = (ModuleDescriptor('pcapkit.dumpkit', 'NotImplementedIO'), None)  # type: tuple[ModuleDescriptor[Dumper], None]
+
 
 class TraceFlowMeta(abc.ABCMeta):
     """Meta class to add dynamic support to :class:`TraceFlow`.
@@ -102,23 +104,21 @@ class TraceFlowBase(Generic[BufferID, Buffer, Index, Packet], metaclass=TraceFlo
     # Defaults.
     ##########################################################################
 
-    #: DefaultDict[str, tuple[ModuleDescriptor[Dumper] | Type[Dumper], str | None]]:
+    #: dict[str, tuple[ModuleDescriptor[Dumper] | Type[Dumper], str | None]]:
     #: Format dumper mapping for writing output files. The values should be a
     #: tuple representing the module name and class name, or a
     #: :class:`dictdumper.dumper.Dumper` subclass, and corresponding file extension.
-    __output__ = collections.defaultdict(
-        lambda: (ModuleDescriptor('pcapkit.dumpkit', 'NotImplementedIO'), None),
-        {
-            'pcap': (ModuleDescriptor('pcapkit.dumpkit', 'PCAPIO'), '.pcap'),
-            'cap': (ModuleDescriptor('pcapkit.dumpkit', 'PCAPIO'), '.pcap'),
-            'plist': (ModuleDescriptor('dictdumper', 'PLIST'), '.plist'),
-            'xml': (ModuleDescriptor('dictdumper', 'PLIST'), '.plist'),
-            'json': (ModuleDescriptor('dictdumper', 'JSON'), '.json'),
-            'tree': (ModuleDescriptor('dictdumper', 'Tree'), '.txt'),
-            'text': (ModuleDescriptor('dictdumper', 'Text'), '.txt'),
-            'txt': (ModuleDescriptor('dictdumper', 'Tree'), '.txt'),
-        },
-    )  # type: DefaultDict[str, tuple[ModuleDescriptor[Dumper] | Type[Dumper], str | None]]
+    #: Unknown formats fall back to :data:`_DEFAULT_OUTPUT`.
+    __output__ = {
+        'pcap': (ModuleDescriptor('pcapkit.dumpkit', 'PCAPIO'), '.pcap'),
+        'cap': (ModuleDescriptor('pcapkit.dumpkit', 'PCAPIO'), '.pcap'),
+        'plist': (ModuleDescriptor('dictdumper', 'PLIST'), '.plist'),
+        'xml': (ModuleDescriptor('dictdumper', 'PLIST'), '.plist'),
+        'json': (ModuleDescriptor('dictdumper', 'JSON'), '.json'),
+        'tree': (ModuleDescriptor('dictdumper', 'Tree'), '.txt'),
+        'text': (ModuleDescriptor('dictdumper', 'Text'), '.txt'),
+        'txt': (ModuleDescriptor('dictdumper', 'Tree'), '.txt'),
+    }  # type: dict[str, tuple[ModuleDescriptor[Dumper] | Type[Dumper], str | None]]
 
     ##########################################################################
     # Properties.
@@ -218,7 +218,7 @@ class TraceFlowBase(Generic[BufferID, Buffer, Index, Packet], metaclass=TraceFlo
             FileExists: If ``fout`` exists and ``fmt`` is **NOT** :data:`None`.
 
         """
-        output, ext = cls.__output__[fmt]
+        output, ext = cls.__output__.get(fmt, _DEFAULT_OUTPUT)
         if ext is None:
             warn(f'Unsupported output format: {fmt}; disabled file output feature',
                  FormatWarning, stacklevel=stacklevel())
@@ -310,6 +310,9 @@ class TraceFlowBase(Generic[BufferID, Buffer, Index, Packet], metaclass=TraceFlo
         self._buffer = {}  # type: dict[BufferID, Buffer]
         #: list[Index]: Stream index (:term:`trace.tcp.index`).
         self._stream = []  # type: list[Index]
+        #: dict[BufferID, Index]: Cached index of flows still in buffer,
+        #: which is reused by :meth:`submit` until the flow is updated.
+        self._opened = {}  # type: dict[BufferID, Index]
 
         #: Literal['little', 'big']: Output file byte order.
         self._endian = byteorder
@@ -9,11 +9,10 @@ interfaces, variables, and etc., which wraps around the
 foundation classes from :mod:`pcapkit.foundation`.
 
 """
-import io
 import sys
 from typing import TYPE_CHECKING
 
-from pcapkit.foundation.extraction import Extractor
+from pcapkit.foundation.extraction import _BUFFER_SIZE, Extractor
 from pcapkit.foundation.reassembly.ipv4 import IPv4 as IPv4_Reassembly
 from pcapkit.foundation.reassembly.ipv6 import IPv6 as IPv6_Reassembly
 from pcapkit.foundation.reassembly.tcp import TCP as TCP_Reassembly
@@ -22,6 +21,7 @@ from pcapkit.protocols.protocol import ProtocolBase as Protocol
 from pcapkit.utilities.exceptions import FormatError
 
 if TYPE_CHECKING:
+    from os import PathLike
     from typing import IO, Optional, Type
 
     from typing_extensions import Literal
@@ -57,8 +57,8 @@ PCAPKit = 'default'
 PyShark = 'pyshark'
 
 
-def extract(fin: 'Optional[str | IO[bytes]]' = None, fout: 'Optional[str]' = None, format: 'Optional[Formats]' = None,     # basic settings # pylint: disable=redefined-builtin
-            auto: 'bool' = True, extension: 'bool' = True, store: 'bool' = True,                                           # internal settings # pylint: disable=line-too-long
+def extract(fin: 'Optional[str | PathLike[str] | IO[bytes]]' = None, fout: 'Optional[str]' = None, format: 'Optional[Formats]' = None, # basic settings # pylint: disable=redefined-builtin
+            auto: 'bool' = True, extension: 'bool' = True, store: 'bool | Literal["columns"]' = True,                      # internal settings # pylint: disable=line-too-long
             files: 'bool' = False, nofile: 'bool' = False, verbose: 'bool | VerboseHandler' = False,                       # output settings # pylint: disable=line-too-long
             engine: 'Optional[Engines]' = None, layer: 'Optional[Layers] | Type[Protocol]' = None,                         # extraction settings # pylint: disable=line-too-long
             protocol: 'Optional[Protocols]' = None,                                                                        # extraction settings # pylint: disable=line-too-long
@@ -66,19 +66,20 @@ def extract(fin: 'Optional[str | IO[bytes]]' = None, fout: 'Optional[str]' = Non
             trace: 'bool' = False, trace_fout: 'Optional[str]' = None, trace_format: 'Optional[Formats]' = None,           # trace settings # pylint: disable=line-too-long
             trace_byteorder: 'Literal["big", "little"]' = sys.byteorder, trace_nanosecond: 'bool' = False,                 # trace settings # pylint: disable=line-too-long
             ip: 'bool' = False, ipv4: 'bool' = False, ipv6: 'bool' = False, tcp: 'bool' = False,                           # reassembly/trace settings # pylint: disable=line-too-long
-            buffer_size: 'int' = io.DEFAULT_BUFFER_SIZE, buffer_save: 'bool' = False, buffer_path: 'Optional[str]' = None, # buffer settings # pylint: disable=line-too-long
+            buffer_size: 'int' = _BUFFER_SIZE, buffer_save: 'bool' = False, buffer_path: 'Optional[str]' = None, # buffer settings # pylint: disable=line-too-long
             no_eof: 'bool' = False) -> 'Extractor':
     """Extract a PCAP file.
 
     Arguments:
-        fin: file name to be read or a binary IO object;
+        fin: file name (or path-like object) to be read or a binary IO object;
             if file not exist, raise :exc:`FileNotFound`
         fout: file name to be written
         format: file format of output
 
         auto: if automatically run till EOF
         extension: if check and append extensions to output file
-        store: if store extracted packet info
+        store: if store extracted packet info; or ``'columns'`` to store
+            only the frame metadata as columnar arrays (for default engines only)
 
         files: if split each frame into different files
         nofile: if no output file is to be dumped
@@ -106,7 +107,8 @@ def extract(fin: 'Optional[str | IO[bytes]]' = None, fout: 'Optional[str]' = Non
         tcp: if perform TCP reassembly and/or flow tracing
             (must be used with ``reassembly=True`` or ``trace=True``)
 
-        buffer_size: buffer size for reading input file (for :class:`~pcapkit.corekit.io.SeekableReader` only)
+        buffer_size: buffer size for reading input file; default to 1 MiB, or the value
+            of the ``PCAPKIT_READ_BUFSIZE`` environment variable if set
         buffer_save: if save buffer to file (for :class:`~pcapkit.corekit.io.SeekableReader` only)
         buffer_path: path name for buffer file if necessary (for :class:`~pcapkit.corekit.io.SeekableReader` only)
 
@@ -28,6 +28,7 @@ as below:
 
 """
 import re
+import sys
 from typing import TYPE_CHECKING
 
 from pcapkit.const.http.method import Method as Enum_Method
@@ -60,6 +61,13 @@ _RE_VERSION = re.compile(rb"HTTP/(?P<version>\d\.\d)")
 # Regular expression to match HTTP status code.
 _RE_STATUS = re.compile(rb'\d{3}')
 
+# Pool of known HTTP version strings.
+_VERSION_POOL = {
+    b'0.9': '0.9',
+    b'1.0': '1.0',
+    b'1.1': '1.1',
+}  # type: dict[bytes, str]
+
 
 class Type(StrEnum):
     """HTTP packet type."""
@@ -271,7 +279,6 @@ class HTTP(HTTPBase[Data_HTTP, Schema_HTTP],
         startline, headerfield = header.split(b'\r\n', 1)
         para1, para2, para3 = re.split(rb'\s+', startline, 2)
         fields = headerfield.split(b'\r\n')
-        lists = (re.split(rb'\s*:\s*', field, 1) for field in fields)
 
         if TYPE_CHECKING:
             header_line: 'Data_Header'
@@ -285,26 +292,47 @@ class HTTP(HTTPBase[Data_HTTP, Schema_HTTP],
                 type=Type.REQUEST,
                 method=Enum_Method.get(self.decode(para1)),
                 uri=self.decode(para2),
-                version=self.decode(match2.group('version')),
+                version=self._read_http_version(match2.group('version')),
             )
         elif match3 and match4:
             header_line = Data_ResponseHeader(
                 type=Type.RESPONSE,
-                version=self.decode(match3.group('version')),
+                version=self._read_http_version(match3.group('version')),
                 status=Enum_StatusCode.get(int(para2)),
-                message=self.decode(para3),
+                message=sys.intern(self.decode(para3)),
             )
         else:
             raise ProtocolError('HTTP: invalid format')
 
-        header_fields = OrderedMultiDict()  # type: OrderedMultiDict[str, str]
-        for item in lists:
-            key = self.decode(item[0].strip())
-            value = self.decode(item[1].strip())
-            header_fields.add(key, value)
-
+        # NOTE: header fields are small and read only once, so we collect
+        # them as plain ``(key, value)`` pairs first and build the ordered
+        # multi-dict in one go afterwards
+        decode = self.decode
+        header_pairs = []  # type: list[tuple[str, str]]
+        for field in fields:
+            key, sep, value = field.partition(b':')
+            if not sep:
+                raise ProtocolError('HTTP: invalid format')
+            header_pairs.append((sys.intern(decode(key.strip())), decode(value.strip())))
+
+        header_fields = OrderedMultiDict(header_pairs)  # type: OrderedMultiDict[str, str]
         return header_line, header_fields
 
+    def _read_http_version(self, version: 'bytes') -> 'str':
+        """Read HTTP/1.* version string.
+
+        Args:
+            version: HTTP version data, e.g., ``b'1.1'``.
+
+        Returns:
+            Parsed (and interned) HTTP version string.
+
+        """
+        version_str = _VERSION_POOL.get(version)
+        if version_str is None:
+            version_str = sys.intern(self.decode(version))
+        return version_str
+
     def _read_http_body(self, body: 'bytes', *,
                         headers: 'OrderedMultiDict[str, str]') -> 'Any':
         """Read HTTP/1.* body.
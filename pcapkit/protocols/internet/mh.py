@@ -23,8 +23,10 @@ Octets      Bits        Name                    Description
 """
 import collections
 import datetime
+import functools
 import ipaddress
 import math
+import time
 from typing import TYPE_CHECKING, cast, overload
 
 from pcapkit.const.mh.access_type import AccessType as Enum_AccessType
@@ -73,6 +75,7 @@ from pcapkit.const.mh.upa_status import \
     UpdateNotificationACKStatus as Enum_UpdateNotificationACKStatus
 from pcapkit.const.mh.upn_reason import UpdateNotificationReason as Enum_UpdateNotificationReason
 from pcapkit.const.reg.transtype import TransType as Enum_TransType
+from pcapkit.corekit.multidict import OrderedMultiDict
 from pcapkit.protocols.data.internet.mh import MH as Data_MH
 from pcapkit.protocols.data.internet.mh import \
     AlternateCareofAddressOption as Data_AlternateCareofAddressOption
@@ -148,12 +151,14 @@ from pcapkit.protocols.schema.internet.mh import \
 from pcapkit.protocols.schema.internet.mh import MultiPrefixExtension as Schema_MultiPrefixExtension
 from pcapkit.protocols.schema.internet.mh import NonceIndicesOption as Schema_NonceIndicesOption
 from pcapkit.protocols.schema.internet.mh import PadOption as Schema_PadOption
+from pcapkit.protocols.schema.internet.mh import Packet as Schema_Packet
 from pcapkit.protocols.schema.internet.mh import \
     PermanentHomeKeygenTokenOption as Schema_PermanentHomeKeygenTokenOption
 from pcapkit.protocols.schema.internet.mh import SignatureOption as Schema_SignatureOption
 from pcapkit.protocols.schema.internet.mh import UnassignedOption as Schema_UnassignedOption
 from pcapkit.protocols.schema.internet.mh import UnknownExtension as Schema_UnknownExtension
 from pcapkit.protocols.schema.internet.mh import UnknownMessage as Schema_UnknownMessage
+from pcapkit.protocols.schema.schema import Schema
 from pcapkit.utilities.exceptions import ProtocolError, UnsupportedCall
 from pcapkit.utilities.warnings import ProtocolWarning, RegistryWarning, warn
 
@@ -161,20 +166,17 @@ if TYPE_CHECKING:
     from datetime import datetime as dt_type
     from datetime import timedelta
     from enum import IntEnum as StdlibEnum
-    from ipaddress import IPv6Address, IPv6Network
+    from ipaddress import IPv4Network, IPv6Address, IPv6Network
     from typing import IO, Any, Callable, DefaultDict, NoReturn, Optional, Type
 
     from aenum import IntEnum as AenumEnum
     from mypy_extensions import DefaultArg, KwArg, NamedArg
     from typing_extensions import Literal
 
-    from pcapkit.corekit.multidict import OrderedMultiDict
     from pcapkit.corekit.protochain import ProtoChain
     from pcapkit.protocols.data.internet.mh import Option as Data_Option
     from pcapkit.protocols.protocol import ProtocolBase as Protocol
     from pcapkit.protocols.schema.internet.mh import Option as Schema_Option
-    from pcapkit.protocols.schema.internet.mh import Packet as Schema_Packet
-    from pcapkit.protocols.schema.schema import Schema
 
     Option = OrderedMultiDict[Enum_Option, Data_Option]
     Extension = OrderedMultiDict[Enum_CGAExtension, Data_CGAExtension]
@@ -196,6 +198,51 @@ __all__ = ['MH']
 NTPTimestamp = collections.namedtuple('NTPTimestamp', 'seconds fraction')
 NTPTimestamp.__doc__ = """NTP timestamp format, c.f., :rfc:`1305`."""
 
+# Seconds between the NTP epoch (1900-01-01) and the UNIX epoch (1970-01-01).
+_NTP_EPOCH_OFFSET = 2_208_988_800
+# UNIX epoch as an aware datetime, for exact (integer) interval arithmetic.
+_UNIX_EPOCH = datetime.datetime(1970, 1, 1, tzinfo=datetime.timezone.utc)
+
+# Plain integer codes of padding options, so that we can check the option
+# type without going through the enum comparison machinery.
+_OPT_CODE_PAD1 = int(Enum_Option.Pad1)
+_OPT_CODE_PADN = int(Enum_Option.PadN)
+
+# Option length (i.e., ``Option Length`` field) validators, keyed by the
+# name of the option parser (i.e., ``_read_opt_<name>``) which checks the
+# length; the alignment checks are done with bit masks rather than modulo.
+_OPT_LEN_VALIDATOR = {
+    'bra': lambda length: length == 2,
+    'aca': lambda length: length == 16,
+    'ni': lambda length: length == 4,
+    'bad': lambda length: (length & 7) == 0,
+    'mnp': lambda length: length == 18,
+    'auth': lambda length: ((length + 1) & 3) == 0,
+    'mesg_id': lambda length: (length & 7) == 0,
+    'cga_pr': lambda length: length == 0,
+    'ct_init': lambda length: length == 0,
+    'ct': lambda length: length == 8,
+}  # type: dict[str, Callable[[int], bool]]
+
+
+@functools.lru_cache(maxsize=1024)
+def _ipv6_network(address: 'IPv6Address', prefixlen: 'int') -> 'IPv6Network':
+    """Create and cache IPv6 network from address and prefix length.
+
+    Args:
+        address: Network address.
+        prefixlen: Network prefix length.
+
+    Returns:
+        IPv6 network, as would be created by :func:`ipaddress.ip_network`.
+
+    Notes:
+        Mobile network prefixes are likely to be repeated across packets,
+        thus we cache the created network objects.
+
+    """
+    return ipaddress.IPv6Network((address, prefixlen))
+
 
 class MH(Internet[Data_MH, Schema_MH],
          schema=Schema_MH, data=Data_MH):
@@ -467,13 +514,11 @@ class MH(Internet[Data_MH, Schema_MH],
         schema = self.__header__
 
         name = self.__message__[schema.type]
-        if isinstance(name, str):
-            meth_name = f'_read_msg_{name}'
-            meth = cast('PacketParser',
-                        getattr(self, meth_name, self._read_msg_unknown))
-        else:
-            meth = name[0]
-        mh = meth(schema.data, header=schema)
+        parsers = self._get_parsers('msg')
+        meth = parsers.get(name)
+        if meth is None:
+            meth = parsers[name] = self._resolve_parser('msg', name, 'unknown')
+        mh = meth(self, schema.data, header=schema)
 
         if extension:
             return mh
@@ -521,17 +566,15 @@ class MH(Internet[Data_MH, Schema_MH],
             data_val = data  # type: bytes | Schema_Packet
         elif isinstance(data, (dict, Data_MH)):
             name = self.__message__[type_val]
-            if isinstance(name, str):
-                meth_name = f'_make_msg_{name}'
-                meth = cast('PacketConstructor',
-                            getattr(self, meth_name, self._make_msg_unknown))
-            else:
-                meth = name[1]
+            constructors = self._get_constructors('msg')
+            meth = constructors.get(name)
+            if meth is None:
+                meth = constructors[name] = self._resolve_constructor('msg', name, 'unknown')
 
             if isinstance(data, dict):
-                data_val = meth(**data)
+                data_val = meth(self, None, **data)
             else:
-                data_val = meth(data)
+                data_val = meth(self, data)
         elif isinstance(data, Schema_Packet):
             data_val = data
         else:
@@ -539,7 +582,7 @@ class MH(Internet[Data_MH, Schema_MH],
 
         return Schema_MH(
             next=next_val,
-            length=math.ceil((len(data_val) + 6) / 8) - 1,
+            length=(len(data_val) + 13) // 8 - 1,
             type=type_val,
             chksum=chksum,
             data=data_val,
@@ -655,6 +698,115 @@ class MH(Internet[Data_MH, Schema_MH],
             'payload': cls._make_payload(data),
         }
 
+    @classmethod
+    def _get_parsers(cls, kind: 'str') -> 'dict[str | tuple[Callable[..., Any], Callable[..., Any]], Callable[..., Any]]':  # pylint: disable=line-too-long
+        """Fetch cached parsers of ``kind``.
+
+        Args:
+            kind: Parser kind, i.e., ``msg`` for messages, ``opt`` for
+                options and ``ext`` for CGA extensions.
+
+        Returns:
+            Mapping from registry entries (i.e., values of :attr:`__message__`,
+            :attr:`__option__` or :attr:`__extension__`) to the resolved parser
+            functions, which take the protocol instance as the first argument.
+
+        Notes:
+            The parsers are cached per class, so that no method name is to be
+            formatted and looked up upon each message, option or CGA extension
+            parsed; and since the cache is keyed by the registry entries, any
+            newly registered parser will be resolved upon its first use.
+
+        """
+        cache = cls.__dict__.get('__parser_cache__')  # type: Optional[dict[str, dict]]
+        if cache is None:
+            cache = {}
+            setattr(cls, '__parser_cache__', cache)
+
+        parsers = cache.get(kind)
+        if parsers is None:
+            parsers = cache[kind] = {}
+        return parsers
+
+    @classmethod
+    def _resolve_parser(cls, kind: 'str', name: 'str | tuple[Callable[..., Any], Callable[..., Any]]',
+                        default: 'str') -> 'Callable[..., Any]':
+        """Resolve parser of ``kind`` from registry entry.
+
+        Args:
+            kind: Parser kind, c.f. :meth:`_get_parsers`.
+            name: Registry entry, i.e., method name or a pair of parser
+                and constructor callables.
+            default: Method name of the default parser, if the method
+                named after ``name`` is not found.
+
+        Returns:
+            Parser function, which takes the protocol instance as the
+            first argument.
+
+        """
+        if isinstance(name, str):
+            meth = getattr(cls, f'_read_{kind}_{name}', None)
+            if meth is None:
+                meth = getattr(cls, f'_read_{kind}_{default}')
+            return meth
+
+        meth = name[0]
+        return lambda self, *args, **kwargs: meth(*args, **kwargs)  # pylint: disable=unnecessary-lambda
+
+    @classmethod
+    def _get_constructors(cls, kind: 'str') -> 'dict[str | tuple[Callable[..., Any], Callable[..., Any]], Callable[..., Any]]':  # pylint: disable=line-too-long
+        """Fetch cached constructors of ``kind``.
+
+        Args:
+            kind: Constructor kind, c.f. :meth:`_get_parsers`.
+
+        Returns:
+            Mapping from registry entries to the resolved constructor
+            functions, which take the protocol instance as the first
+            argument.
+
+        Notes:
+            The constructors are cached per class in the same manner as
+            the parsers, c.f., :meth:`_get_parsers`.
+
+        """
+        cache = cls.__dict__.get('__constructor_cache__')  # type: Optional[dict[str, dict]]
+        if cache is None:
+            cache = {}
+            setattr(cls, '__constructor_cache__', cache)
+
+        constructors = cache.get(kind)
+        if constructors is None:
+            constructors = cache[kind] = {}
+        return constructors
+
+    @classmethod
+    def _resolve_constructor(cls, kind: 'str', name: 'str | tuple[Callable[..., Any], Callable[..., Any]]',
+                             default: 'str') -> 'Callable[..., Any]':
+        """Resolve constructor of ``kind`` from registry entry.
+
+        Args:
+            kind: Constructor kind, c.f. :meth:`_get_parsers`.
+            name: Registry entry, i.e., method name or a pair of parser
+                and constructor callables.
+            default: Method name of the default constructor, if the method
+                named after ``name`` is not found.
+
+        Returns:
+            Constructor function, which takes the protocol instance as the
+            first argument.
+
+        """
+        if isinstance(name, str):
+            meth = getattr(cls, f'_make_{kind}_{name}', None)
+            if meth is None:
+                meth = getattr(cls, f'_make_{kind}_{default}')
+            return meth
+
+        meth = name[1]
+        return lambda self, *args, **kwargs: meth(*args, **kwargs)  # pylint: disable=unnecessary-lambda
+
     def _read_msg_unknown(self, schema: 'Schema_UnknownMessage', *,
                           header: 'Schema_MH') -> 'Data_UnknownMessage':
         """Read unknown MH message type.
@@ -1034,26 +1186,29 @@ class MH(Internet[Data_MH, Schema_MH],
 
         """
         options = OrderedMultiDict()  # type: Option
+        parsers = self._get_parsers('opt')
+
+        # NOTE: bind frequently used lookups to local names for the loop
+        registry = self.__option__
+        get_parser = parsers.get
+        add_option = options.add
 
         for schema in options_schema:
             type = schema.type
-            name = self.__option__[type]
+            name = registry[type]
 
-            if isinstance(name, str):
-                meth_name = f'_read_opt_{name}'
-                meth = cast('OptionParser',
-                            getattr(self, meth_name, self._read_opt_none))
-            else:
-                meth = name[0]
-            data = meth(schema, options=options)
+            meth = get_parser(name)
+            if meth is None:
+                meth = parsers[name] = self._resolve_parser('opt', name, 'none')
+            data = meth(self, schema, options=options)
 
             # record option data
-            options.add(type, data)
+            add_option(type, data)
 
         return options
 
-    def _read_opt_none(self, schema: 'Schema_UnassignedOption', *
-                             options: 'Option') -> 'Data_UnassignedOption':
+    def _read_opt_none(self, schema: 'Schema_UnassignedOption', *,
+                       options: 'Option') -> 'Data_UnassignedOption':
         """Read MH unassigned option.
 
         Args:
@@ -1106,18 +1261,18 @@ class MH(Internet[Data_MH, Schema_MH],
 
         """
         code, clen = schema.type, schema.length
+        code_int = int(code)
 
-        if code not in (Enum_Option.Pad1, Enum_Option.PadN):
-            raise ProtocolError(f'{self.alias}: [OptNo {code}] invalid format')
-        if code == Enum_Option.Pad1 and clen != 0:
-            raise ProtocolError(f'{self.alias}: [OptNo {code}] invalid format')
-        if code == Enum_Option.PadN and clen == 0:
-            raise ProtocolError(f'{self.alias}: [OptNo {code}] invalid format')
-
-        if code == Enum_Option.Pad1:
+        if code_int == _OPT_CODE_PAD1:
+            if clen != 0:
+                raise ProtocolError(f'{self.alias}: [OptNo {code}] invalid format')
             size = 1
-        else:
+        elif code_int == _OPT_CODE_PADN:
+            if clen == 0:
+                raise ProtocolError(f'{self.alias}: [OptNo {code}] invalid format')
             size = clen + 2
+        else:
+            raise ProtocolError(f'{self.alias}: [OptNo {code}] invalid format')
 
         data = Data_PadOption(
             type=schema.type,
@@ -1149,7 +1304,7 @@ class MH(Internet[Data_MH, Schema_MH],
             Constructed option data.
 
         """
-        if schema.length != 2:
+        if not _OPT_LEN_VALIDATOR['bra'](schema.length):
             raise ProtocolError(f'{self.alias}: [Opt {schema.type}] invalid format')
 
         data = Data_BindingRefreshAdviceOption(
@@ -1189,7 +1344,7 @@ class MH(Internet[Data_MH, Schema_MH],
             Constructed option data.
 
         """
-        if schema.length != 16:
+        if not _OPT_LEN_VALIDATOR['aca'](schema.length):
             raise ProtocolError(f'{self.alias}: [Opt {schema.type}] invalid format')
 
         data = Data_AlternateCareofAddressOption(
@@ -1223,7 +1378,7 @@ class MH(Internet[Data_MH, Schema_MH],
             Constructed option data.
 
         """
-        if schema.length != 4:
+        if not _OPT_LEN_VALIDATOR['ni'](schema.length):
             raise ProtocolError(f'{self.alias}: [Opt {schema.type}] invalid format')
 
         data = Data_NonceIndicesOption(
@@ -1262,7 +1417,7 @@ class MH(Internet[Data_MH, Schema_MH],
             Constructed option data.
 
         """
-        if schema.length % 8 != 0:
+        if not _OPT_LEN_VALIDATOR['bad'](schema.length):
             raise ProtocolError(f'{self.alias}: [Opt {schema.type}] invalid format')
 
         data = Data_AuthorizationDataOption(
@@ -1302,11 +1457,10 @@ class MH(Internet[Data_MH, Schema_MH],
             Constructed option data.
 
         """
-        if schema.length != 18:
+        if not _OPT_LEN_VALIDATOR['mnp'](schema.length):
             raise ProtocolError(f'{self.alias}: [Opt {schema.type}] invalid format')
 
-        prefix = cast('IPv6Network',
-                      ipaddress.ip_network((schema.prefix, schema.prefix_length)))
+        prefix = _ipv6_network(schema.prefix, schema.prefix_length)
 
         data = Data_MobileNetworkPrefixOption(
             type=schema.type,
@@ -1408,7 +1562,7 @@ class MH(Internet[Data_MH, Schema_MH],
             Constructed option data.
 
         """
-        if (schema.length + 1) % 4 != 0:
+        if not _OPT_LEN_VALIDATOR['auth'](schema.length):
             raise ProtocolError(f'{self.alias}: [Opt {schema.type}] invalid format')
 
         data = Data_AuthOption(
@@ -1446,7 +1600,7 @@ class MH(Internet[Data_MH, Schema_MH],
             Constructed option data.
 
         """
-        if (schema.length) % 8 != 0:
+        if not _OPT_LEN_VALIDATOR['mesg_id'](schema.length):
             raise ProtocolError(f'{self.alias}: [Opt {schema.type}] invalid format')
 
         data = Data_MesgIDOption(
@@ -1479,7 +1633,7 @@ class MH(Internet[Data_MH, Schema_MH],
             Constructed option data.
 
         """
-        if schema.length != 0:
+        if not _OPT_LEN_VALIDATOR['cga_pr'](schema.length):
             raise ProtocolError(f'{self.alias}: [Opt {schema.type}] invalid format')
 
         data = Data_CGAParametersRequestOption(
@@ -1516,20 +1670,25 @@ class MH(Internet[Data_MH, Schema_MH],
             Constructed option data.
 
         """
+        parameters = []  # type: list[Data_CGAParameter]
         for param in schema.parameters:
-            if param.collision_count not in (0, 1, 2):
+            # NOTE: collision count is an unsigned integer, which can
+            # only be 0, 1 or 2 [:rfc:`3972`]
+            if param.collision_count > 2:
                 raise ProtocolError(f'{self.alias}: [Opt {schema.type}] invalid format')
 
-        data = Data_CGAParametersOption(
-            type=schema.type,
-            length=schema.length + 2,
-            parameters=tuple(Data_CGAParameter(
+            parameters.append(Data_CGAParameter(
                 modifier=param.modifier,
                 prefix=param.prefix,
                 collision_count=param.collision_count,
                 public_key=param.public_key,
                 extensions=self._read_cga_extensions(param.extensions),
-            ) for param in schema.parameters),
+            ))
+
+        data = Data_CGAParametersOption(
+            type=schema.type,
+            length=schema.length + 2,
+            parameters=tuple(parameters),
         )
         return data
 
@@ -1625,7 +1784,7 @@ class MH(Internet[Data_MH, Schema_MH],
             Constructed option data.
 
         """
-        if schema.length != 0:
+        if not _OPT_LEN_VALIDATOR['ct_init'](schema.length):
             raise ProtocolError(f'{self.alias}: [Opt {schema.type}] invalid format')
 
         data = Data_CareofTestInitOption(
@@ -1660,7 +1819,7 @@ class MH(Internet[Data_MH, Schema_MH],
             Constructed option data.
 
         """
-        if schema.length != 8:
+        if not _OPT_LEN_VALIDATOR['ct'](schema.length):
             raise ProtocolError(f'{self.alias}: [Opt {schema.type}] invalid format')
 
         data = Data_CareofTestOption(
@@ -1697,21 +1856,24 @@ class MH(Internet[Data_MH, Schema_MH],
 
         """
         extensions = OrderedMultiDict()  # type: Extension
+        parsers = self._get_parsers('ext')
+
+        # NOTE: bind frequently used lookups to local names for the loop
+        registry = self.__extension__
+        get_parser = parsers.get
+        add_extension = extensions.add
 
         for schema in extensions_schema:
             type = schema.type
-            name = self.__extension__[type]
+            name = registry[type]
 
-            if isinstance(name, str):
-                meth_name = f'_read_ext_{name}'
-                meth = cast('ExtensionParser',
-                            getattr(self, meth_name, self._read_ext_none))
-            else:
-                meth = name[0]
-            data = meth(schema, extensions=extensions)
+            meth = get_parser(name)
+            if meth is None:
+                meth = parsers[name] = self._resolve_parser('ext', name, 'none')
+            data = meth(self, schema, extensions=extensions)
 
             # record extension data
-            extensions.add(type, data)
+            add_extension(type, data)
 
         return extensions
 
@@ -1998,7 +2160,7 @@ class MH(Internet[Data_MH, Schema_MH],
                 'L': lla_compat,
                 'K': key_mngt,
             },
-            lifetime=math.ceil(lifetime_val / 4),
+            lifetime=(lifetime_val + 3) // 4,
             options=self._make_mh_options(options),
         )
 
@@ -2048,7 +2210,7 @@ class MH(Internet[Data_MH, Schema_MH],
                 'K': key_mngt,
             },
             seq=seq,
-            lifetime=math.ceil(lifetime_val / 4),
+            lifetime=(lifetime_val + 3) // 4,
             options=self._make_mh_options(options),
         )
 
@@ -2103,6 +2265,8 @@ class MH(Internet[Data_MH, Schema_MH],
             Mobility options list.
 
         """
+        constructors = self._get_constructors('opt')
+
         if isinstance(options, list):
             options_list = []  # type: list[Schema_Option | bytes]
             for schema in options:
@@ -2115,13 +2279,11 @@ class MH(Internet[Data_MH, Schema_MH],
                 else:
                     code, args = cast('tuple[Enum_Option, dict[str, Any]]', schema)
                     name = self.__option__[code]
-                    if isinstance(name, str):
-                        meth_name = f'_make_opt_{name}'
-                        meth = cast('OptionConstructor',
-                                    getattr(self, meth_name, self._make_opt_none))
-                    else:
-                        meth = name[1]
-                    data = meth(code, **args)
+
+                    meth = constructors.get(name)
+                    if meth is None:
+                        meth = constructors[name] = self._resolve_constructor('opt', name, 'none')
+                    data = meth(self, code, **args)
 
                 options_list.append(data)
             return options_list
@@ -2129,14 +2291,12 @@ class MH(Internet[Data_MH, Schema_MH],
         options_list = []
         for code, option in options.items(multi=True):
             name = self.__option__[code]
-            if isinstance(name, str):
-                meth_name = f'_make_opt_{name}'
-                meth = cast('OptionConstructor',
-                            getattr(self, meth_name, self._make_opt_none))
-            else:
-                meth = name[1]
 
-            data = meth(code, option)
+            meth = constructors.get(name)
+            if meth is None:
+                meth = constructors[name] = self._resolve_constructor('opt', name, 'none')
+            data = meth(self, code, option)
+
             options_list.append(data)
         return options_list
 
@@ -2179,8 +2339,9 @@ class MH(Internet[Data_MH, Schema_MH],
             Constructed option schema.
 
         """
-        if  option is not None:
-            length = option.length
+        if option is not None:
+            # NOTE: the data model records the size of the whole option
+            length = max(option.length - 2, 0)
 
         if type == Enum_Option.Pad1 and length != 0:
             # raise ProtocolError(f'{self.alias}: [OptNo {type}] invalid format')
@@ -2290,7 +2451,7 @@ class MH(Internet[Data_MH, Schema_MH],
         if option is not None:
             data = option.data
 
-        if len(data) % 8 != 0:
+        if len(data) & 7:
             raise ProtocolError(f'{self.alias}: [OptNo {type}] invalid format')
 
         return Schema_AuthorizationDataOption(
@@ -2317,7 +2478,10 @@ class MH(Internet[Data_MH, Schema_MH],
         if option is not None:
             prefix = option.prefix
 
-        prefix_val = ipaddress.ip_network(prefix)
+        if isinstance(prefix, ipaddress.IPv6Network):
+            prefix_val = prefix  # type: IPv6Network | IPv4Network
+        else:
+            prefix_val = ipaddress.ip_network(prefix)
         if prefix_val.version != 6:
             raise ProtocolError(f'{self.alias}: [OptNo {type}] invalid movile network prefix: {prefix!r}')
         prefix_length = prefix_val.prefixlen
@@ -2388,7 +2552,7 @@ class MH(Internet[Data_MH, Schema_MH],
         if isinstance(identifier, ipaddress.IPv6Address):
             id_len = 16
         elif isinstance(identifier, int):
-            id_len = math.ceil(identifier.bit_length() / 8)
+            id_len = (identifier.bit_length() + 7) // 8
         else:
             id_len = len(identifier)
 
@@ -2432,7 +2596,7 @@ class MH(Internet[Data_MH, Schema_MH],
             subtype_val = self._make_index(subtype, subtype_default, namespace=subtype_namespace,  # type: ignore[assignment]
                                            reversed=subtype_reversed, pack=False)
 
-        if (len(data) + 6) % 4 != 0:
+        if (len(data) + 6) & 3:
             raise ProtocolError(f'{self.alias}: [OptNo {type}] invalid format')
 
         return Schema_AuthOption(
@@ -2464,13 +2628,21 @@ class MH(Internet[Data_MH, Schema_MH],
             timestamp = option.ntp_timestamp
 
         if timestamp is None:
-            interval = interval or datetime.datetime.now(datetime.timezone.utc)
+            if interval is None:
+                ts_nsec = time.time_ns()
+                ts_sec, ts_rem = divmod(ts_nsec, 1_000_000_000)
+                ts_frc = (ts_rem << 32) // 1_000_000_000
+            else:
+                # NOTE: naive datetime is considered as local time, same as
+                # :meth:`datetime.datetime.timestamp` does
+                if interval.tzinfo is None:
+                    interval = interval.astimezone()
 
-            int_ts = interval.timestamp()
-            ts_sec = math.floor(int_ts)
-            ts_frc = math.ceil(((int_ts - ts_sec) * 1_000_000)) * 2**32
+                ts_usec = (interval - _UNIX_EPOCH) // datetime.timedelta(microseconds=1)
+                ts_sec, ts_rem = divmod(ts_usec, 1_000_000)
+                ts_frc = (ts_rem << 32) // 1_000_000
 
-            timestamp = NTPTimestamp(seconds=ts_sec + 2_208_988_800,  # 70 years
+            timestamp = NTPTimestamp(seconds=ts_sec + _NTP_EPOCH_OFFSET,
                                      fraction=ts_frc)
 
         return Schema_MesgIDOption(
@@ -2652,6 +2824,8 @@ class MH(Internet[Data_MH, Schema_MH],
 
         """
         total_length = 0
+        constructors = self._get_constructors('ext')
+
         if isinstance(extensions, list):
             extensions_list = []  # type: list[Schema_CGAExtension | bytes]
             for schema in extensions:
@@ -2662,19 +2836,16 @@ class MH(Internet[Data_MH, Schema_MH],
                     data_len = len(data)
                 elif isinstance(schema, Schema):
                     data = schema
-                    data_len = len(schema.pack())
+                    data_len = len(schema)
                 else:
                     code, args = cast('tuple[Enum_CGAExtension, dict[str, Any]]', schema)
                     name = self.__extension__[code]
-                    if isinstance(name, str):
-                        meth_name = f'_make_ext_{name}'
-                        meth = cast('ExtensionConstructor',
-                                    getattr(self, meth_name, self._make_ext_none))
-                    else:
-                        meth = name[1]
 
-                    data = meth(code, **args)
-                    data_len = len(data.pack())
+                    meth = constructors.get(name)
+                    if meth is None:
+                        meth = constructors[name] = self._resolve_constructor('ext', name, 'none')
+                    data = meth(self, code, **args)
+                    data_len = len(data)
 
                 extensions_list.append(data)
                 total_length += data_len
@@ -2683,15 +2854,12 @@ class MH(Internet[Data_MH, Schema_MH],
         extensions_list = []
         for code, extension in extensions.items(multi=True):
             name = self.__extension__[code]
-            if isinstance(name, str):
-                meth_name = f'_make_ext_{name}'
-                meth = cast('ExtensionConstructor',
-                            getattr(self, meth_name, self._make_ext_none))
-            else:
-                meth = name[1]
 
-            data = meth(code, extension)
-            data_len = len(data.pack())
+            meth = constructors.get(name)
+            if meth is None:
+                meth = constructors[name] = self._resolve_constructor('ext', name, 'none')
+            data = meth(self, code, extension)
+            data_len = len(data)
 
             extensions_list.append(data)
             total_length += data_len
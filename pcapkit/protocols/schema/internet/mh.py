@@ -205,7 +205,7 @@ class Option(EnumSchema[Enum_Option]):
 
         """
         # for Pad1 option, length is always 1
-        if self.type == Enum_Option.pad1:
+        if self.type == Enum_Option.Pad1:
             self.length = 0
         return self
 
@@ -227,7 +227,7 @@ class PadOption(Option, code=[Enum_Option.Pad1,
     """Header schema for MH padding options."""
 
     #: Option data.
-    data: 'bytes' = PaddingField(length=lambda pkt: pkt.get('length', 0))
+    data: 'bytes' = PaddingField(length=lambda pkt: pkt.get('length') or 0)
 
     if TYPE_CHECKING:
         def __init__(self, type: 'Enum_Option', length: 'int') -> 'None': ...
@@ -65,7 +65,10 @@ def schema_final(cls: 'ST', *, _finalised: 'bool' = True) -> 'ST':
             '__payload__', '__finalised__']
     temp.extend(cls.__additional__)
     for obj in cls.mro():
-        temp.extend(dir(obj))
+        # NOTE: fields are class attributes as well, but they are not to be
+        # considered as builtin names, otherwise all field values would be
+        # renamed upon construction and then shadowed by the fields
+        temp.extend(key for key, val in vars(obj).items() if not isinstance(val, FieldBase))
     cls.__builtin__ = set(temp)
     cls.__excluded__.extend(cls.__builtin__)
 
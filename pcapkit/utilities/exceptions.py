@@ -18,7 +18,6 @@ import io
 import os
 import struct
 import sys
-import traceback
 from typing import TYPE_CHECKING
 
 from pcapkit.utilities.compat import ModuleNotFoundError  # pylint: disable=redefined-builtin
@@ -55,18 +54,36 @@ __all__ = [
 def stacklevel() -> 'int':
     """Fetch current stack level.
 
-    The function will walk through the straceback stack (:func:`traceback.extract_stack`),
-    and fetch the stack level where the path contains ``/pcapkit/``. So that it won't
+    The function will walk through the straceback stack (as :func:`traceback.extract_stack`
+    does), and fetch the stack level where the path contains ``/pcapkit/``. So that it won't
     display any disturbing internal traceback information when raising errors.
 
     Returns:
         Stack level until internal stacks, i.e. contains ``/pcapkit/``.
 
+    Notes:
+        Only the file names of the stack frames are inspected, thus we walk
+        through the frame objects directly rather than calling
+        :func:`traceback.extract_stack`, which also looks up the source lines.
+
     """
     pcapkit = f'{os.path.sep}pcapkit{os.path.sep}'
-    tb = traceback.extract_stack()
-    for index, tbitem in enumerate(tb):
-        if pcapkit in tbitem[0]:
+
+    # NOTE: same as traceback.extract_stack, the stack is truncated
+    # to the innermost sys.tracebacklimit frames if it is set
+    limit = getattr(sys, 'tracebacklimit', None)
+    if limit is not None and limit < 0:
+        limit = 0
+
+    tb = []  # type: list[str]
+    frame = sys._getframe()  # pylint: disable=protected-access
+    while frame is not None and (limit is None or len(tb) < limit):
+        tb.append(frame.f_code.co_filename)
+        frame = frame.f_back
+    tb.reverse()
+
+    for index, filename in enumerate(tb):
+        if pcapkit in filename:
             break
     else:
         index = len(tb)
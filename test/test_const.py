@@ -0,0 +1,30 @@
+# -*- coding: utf-8 -*-
+
+from pcapkit.const.hip.ecdsa_curve import ECDSACurve
+from pcapkit.const.ipv6.routing import Routing
+from pcapkit.const.mh.status_code import StatusCode
+
+# unassigned members are reachable as class attributes
+assert Routing.get(7) is Routing.Unassigned_7 is Routing(7)
+assert StatusCode.get(200) is StatusCode.Unassigned_200 is StatusCode(200)
+assert ECDSACurve.get(4096) is ECDSACurve.Unassigned_4096 is ECDSACurve(4096)
+
+for enum in (Routing, StatusCode, ECDSACurve):
+    # new name for an unknown value
+    member = enum.get('Test_Extend', 0x1_0000)
+    assert getattr(enum, 'Test_Extend') is member is enum['Test_Extend']
+    assert enum.get(0x1_0000) is member is enum(0x1_0000)
+
+    # new name as alias of a known value
+    alias = enum.get('Test_Alias', 1)
+    assert getattr(enum, 'Test_Alias') is alias is enum(1)
+
+# values out of range
+for enum, limit in ((Routing, 0xFF), (StatusCode, 0xFF), (ECDSACurve, 0xFFFF)):
+    for value in (-1, limit + 2):
+        try:
+            enum(value)
+        except ValueError:
+            pass
+        else:
+            raise AssertionError(f'{enum.__name__}({value}) should fail')
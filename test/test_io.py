@@ -0,0 +1,92 @@
+# -*- coding: utf-8 -*-
+
+import io
+import mmap
+import os
+import tempfile
+import unittest.mock
+
+import pcapkit
+from pcapkit.corekit.io import MemoryMappedReader, SeekableReader
+from pcapkit.foundation import extraction
+
+SAMPLES = {
+    # path name: (captured length, original length) attributes of frame info
+    '../sample/in.pcap': ('cap_len', 'len'),
+    '../sample/dhcp.pcapng': ('captured_len', 'original_len'),
+}
+
+
+class Pipe(io.RawIOBase):
+    """Non-seekable raw stream returning short reads."""
+
+    name = '<pipe>'
+
+    def __init__(self, data: bytes) -> None:
+        self._data = io.BytesIO(data)
+
+    def readable(self) -> bool:
+        return True
+
+    def readinto(self, b) -> int:  # type: ignore[no-untyped-def,override]
+        data = self._data.read(min(len(b), 7))
+        b[:len(data)] = data
+        return len(data)
+
+
+def frames(result: extraction.Extractor) -> list[bytes]:
+    return [bytes(frame) for frame in result.frame]
+
+
+def make_pcap(path: str, repeat: int) -> None:
+    """Write a PCAP file with the frames of ``in.pcap`` repeated."""
+    with open('../sample/in.pcap', 'rb') as file:
+        data = file.read()
+    with open(path, 'wb') as file:
+        file.write(data[:24] + data[24:] * repeat)
+
+
+# consumed pages of memory-mapped input are dropped under streaming-only mode
+count = pcapkit.extract(fin='../sample/in.pcap', store=False, nofile=True).length
+
+with tempfile.TemporaryDirectory() as tempdir:
+    path = os.path.join(tempdir, 'in.pcap')
+    make_pcap(path, 64)
+
+    with unittest.mock.patch.object(extraction, '_DONTNEED_SIZE', mmap.PAGESIZE), \
+            unittest.mock.patch.object(MemoryMappedReader, 'madvise', autospec=True,
+                                       side_effect=MemoryMappedReader.madvise) as madvise:
+        result = pcapkit.extract(fin=path, store=False, nofile=True)
+
+assert result.length == count * 64
+if hasattr(mmap, 'MADV_DONTNEED'):
+    assert madvise.call_count > 0
+    for call in madvise.call_args_list:
+        _, option, start, length = call.args
+        assert option == mmap.MADV_DONTNEED
+        assert start % mmap.PAGESIZE == 0 and length % mmap.PAGESIZE == 0
+
+for path, (cap_len, orig_len) in SAMPLES.items():
+    expected = pcapkit.extract(fin=path, nofile=True)
+    assert len(expected.frame) > 0
+
+    # memory-mapped input against plain file input
+    result = pcapkit.extract(fin=path, nofile=True)
+    assert isinstance(result._ifile, MemoryMappedReader)
+
+    with open(path, 'rb') as file:
+        assert frames(pcapkit.extract(fin=file, nofile=True)) == frames(result)
+
+    # frame metadata in columns
+    result = pcapkit.extract(fin=path, nofile=True, store='columns')
+
+    columns = result.frame_columns
+    assert all(len(column) == len(expected.frame) for column in columns.values())
+    assert list(columns['captured_len']) == [frame.info[cap_len] for frame in expected.frame]
+    assert list(columns['original_len']) == [frame.info[orig_len] for frame in expected.frame]
+
+    # non-seekable input through SeekableReader
+    with open(path, 'rb') as file:
+        result = pcapkit.extract(fin=Pipe(file.read()), nofile=True)
+    assert isinstance(result._ifile, SeekableReader)
+    assert frames(result) == frames(expected)
@@ -0,0 +1,84 @@
+# -*- coding: utf-8 -*-
+
+import datetime
+import io
+import ipaddress
+
+from pcapkit.const.mh.option import Option
+from pcapkit.const.mh.packet import Packet
+from pcapkit.const.reg.transtype import TransType
+from pcapkit.protocols.data.internet.mh import MH as Data_MH
+from pcapkit.protocols.internet.mh import MH
+from pcapkit.protocols.schema.internet.mh import MH as Schema_MH
+
+# Binding Update with Pad1, PadN, Binding Refresh Advice, Nonce Indices
+# and Alternate Care-of Address options, padded to 8-octet units
+DATA = bytes.fromhex(
+    '3b05' '0500' '0000'                              # next, length, type, reserved, checksum
+    '0001' '8000' '000a'                              # sequence, flags (A), lifetime
+    '00'                                              # Pad1
+    '010100'                                          # PadN
+    '02020005'                                        # Binding Refresh Advice
+    '040400010002'                                    # Nonce Indices
+    '031020010db8000000000000000000000001'            # Alternate Care-of Address
+    '01020000'                                        # PadN
+)
+
+
+def check(mh: MH) -> None:
+    info = mh.info
+    assert info.next == TransType.IPv6_NoNxt
+    assert info.type == Packet.Binding_Update
+    assert info.length == len(DATA)
+    assert info.seq == 1
+    assert info.ack and not (info.home or info.lla_compat or info.key_mngt)
+    assert info.lifetime == datetime.timedelta(seconds=40)
+
+    options = list(info.options.items(multi=True))
+    assert [code for code, _ in options] == [
+        Option.Pad1, Option.PadN, Option.Binding_Refresh_Advice,
+        Option.Nonce_Indices, Option.Alternate_Care_of_Address, Option.PadN,
+    ]
+    assert [option.length for _, option in options] == [1, 3, 4, 6, 18, 4]
+    assert options[2][1].interval == 5
+    assert (options[3][1].home, options[3][1].careof) == (1, 2)
+    assert options[4][1].address == ipaddress.IPv6Address('2001:db8::1')
+
+
+# parse
+check(MH(io.BytesIO(DATA), len(DATA)))
+
+# build from keyword arguments
+mh = MH(next=TransType.IPv6_NoNxt, type=Packet.Binding_Update, data={
+    'seq': 1,
+    'ack': True,
+    'lifetime': 40,
+    'options': [
+        (Option.Pad1, {}),
+        (Option.PadN, {'length': 1}),
+        (Option.Binding_Refresh_Advice, {'interval': 5}),
+        (Option.Nonce_Indices, {'home': 1, 'careof': 2}),
+        (Option.Alternate_Care_of_Address, {'address': '2001:db8::1'}),
+        (Option.PadN, {'length': 2}),
+    ],
+})
+assert mh.data == DATA
+check(MH(io.BytesIO(mh.data), len(mh.data)))
+
+# rebuild from the parsed data model
+info = MH(io.BytesIO(DATA), len(DATA)).info
+assert MH(next=TransType.IPv6_NoNxt, type=Packet.Binding_Update, data=info).data == DATA
+
+
+# per-class option parser dispatch
+class Sub(MH, schema=Schema_MH, data=Data_MH):
+    def _read_opt_bra(self, schema, *, options):  # type: ignore[no-untyped-def]
+        return 'overridden'
+
+
+# unassigned option in place of the trailing PadN option
+data = DATA[:-4] + bytes.fromhex('c802aabb')
+
+options = list(Sub(io.BytesIO(data), len(data)).info.options.items(multi=True))
+assert options[2][1] == 'overridden'
+assert options[5][0] == 200 and options[5][1].data == b'\xaa\xbb'
@@ -0,0 +1,9 @@
+# -*- coding: utf-8 -*-
+
+from pcapkit.foundation.extraction import Extractor
+
+# default arguments, i.e., frames are neither sent back nor dumped by the workers
+result = Extractor.run_many(['../sample/in.pcap', '../sample/dhcp.pcapng'], workers=2)
+
+assert [fin for fin, *_ in result] == ['../sample/in.pcap', '../sample/dhcp.pcapng']
+assert all(frame is None for _, frame, _, _ in result)
@@ -0,0 +1,16 @@
+# -*- coding: utf-8 -*-
+
+from pcapkit.const.reg.transtype import TransType
+from pcapkit.protocols.schema.internet.ipv6_frag import IPv6_Frag
+
+# schema built from keyword arguments, with the ``mf`` flag cleared
+schema = IPv6_Frag(next=TransType.UDP, flags={'offset': 185, 'mf': 0}, id=0x12345678, payload=b'data')
+assert schema.next == TransType.UDP and schema.id == 0x12345678
+assert schema.pack() == bytes.fromhex('1100' '05c8' '12345678') + b'data'
+
+# and then with the ``mf`` flag set
+schema = IPv6_Frag(next=TransType.UDP, flags={'offset': 185, 'mf': 1}, id=0x12345678, payload=b'data')
+assert schema.pack() == bytes.fromhex('1100' '05c9' '12345678') + b'data'
+
+# round trip
+assert IPv6_Frag.unpack(schema.pack(), None, None).flags == {'offset': 185, 'mf': 1}